@@ -1,22 +1,97 @@
+import json
 import click
 from .core.engine import PipelineEngine
+from .core.report import compare_reports, load_report
 from .utils.logging import setup_logging
 from .config import settings
 
+def _write_report(engine: PipelineEngine, report_path: str, baseline_path: str, tolerance: float = 0.1) -> bool:
+    """Write the run report (if a path is given) and compare it to a baseline; False if regressions were found."""
+    if engine.last_report is None:
+        return True
+    data = engine.last_report.write_json(report_path) if report_path else engine.last_report.to_dict()
+    if not baseline_path:
+        return True
+    regressions = compare_reports(data, load_report(baseline_path), tolerance=tolerance)
+    for regression in regressions:
+        click.echo(f"REGRESSION: {regression}", err=True)
+    return not regressions
+
 @click.command()
 @click.option('--url', default=None, help='Override Base URL')
 @click.option('--retries', default=None, type=int, help='Override Max Retries')
 @click.option('--log-file', default='recovery.log', help='Log file path')
-def main(url, retries, log_file):
+@click.option('--orders', 'orders_file', default=None, type=click.Path(exists=True), help='JSON Lines file of orders to run as a batch')
+@click.option('--order-budget', default=None, type=float, help='Override per-order deadline budget (seconds)')
+@click.option('--batch-budget', default=None, type=float, help='Override per-batch deadline budget (seconds)')
+@click.option('--report', 'report_path', default=None, help='Write a JSON run report to this path')
+@click.option('--baseline', 'baseline_path', default=None, type=click.Path(exists=True), help='Previous run report to check for regressions')
+@click.option('--tolerance', default=0.1, type=float, show_default=True, help='Relative change allowed before --baseline flags a regression')
+@click.option('--record-trace', 'trace_path', default=None, help='Record live traffic to a JSON Lines trace for healing-loadtest')
+def main(url, retries, log_file, orders_file, order_budget, batch_budget, report_path, baseline_path, tolerance, trace_path):
     """Run the Self-Healing Automation Pipeline."""
     setup_logging(log_file)
-    
+
+    recorder = None
+    if trace_path:
+        from .faults import RecordingSession
+        from .utils.http import set_session
+        recorder = RecordingSession()
+        set_session(recorder)
+        # Background health probes share the session and would interleave with ingestion traffic
+        settings.HEALTH_CHECK_ENABLED = False
+
     # Use config defaults if not provided via CLI
-    engine = PipelineEngine(url=url, retries=retries)
-    success = engine.run()
-    
+    engine = PipelineEngine(url=url, retries=retries, order_budget=order_budget, batch_budget=batch_budget)
+
+    if orders_file:
+        with open(orders_file, encoding="utf-8") as f:
+            orders = [json.loads(line) for line in f if line.strip()]
+        results = engine.run_batch(orders)
+        success = all(r.get('status') == 'success' for r in results)
+    else:
+        success = engine.run()
+
+    if recorder is not None and recorder.events:
+        recorder.trace().save(trace_path)
+        click.echo(f"Recorded {len(recorder.events)} responses to {trace_path}")
+
+    if not _write_report(engine, report_path, baseline_path, tolerance):
+        success = False
+
     if not success:
         exit(1)
 
+@click.command()
+@click.option('--retries', default=None, type=int, help='Override Max Retries')
+@click.option('--limit', default=None, type=int, help='Maximum number of dead-lettered orders to replay')
+@click.option('--log-file', default='recovery.log', help='Log file path')
+@click.option('--report', 'report_path', default=None, help='Write a JSON run report to this path')
+def replay(retries, limit, log_file, report_path):
+    """Replay dead-lettered orders through the pipeline."""
+    setup_logging(log_file)
+
+    engine = PipelineEngine(retries=retries)
+    results = engine.replay_dead_letters(limit=limit)
+    _write_report(engine, report_path, None)
+
+    if not all(r.get('status') == 'success' for r in results):
+        exit(1)
+
+@click.command()
+@click.option('--trace', 'trace_file', default=None, type=click.Path(exists=True), help='JSON Lines traffic trace (defaults to a 429-then-200 demo)')
+@click.option('--scenarios', default=1000, type=int, help='Number of healing scenarios to replay')
+@click.option('--retries', default=None, type=int, help='Override Max Retries')
+@click.option('--seed', default=0, type=int, help='Seed for the recovery policy exploration')
+@click.option('--log-file', default='loadtest.log', help='Log file path')
+def loadtest(trace_file, scenarios, retries, seed, log_file):
+    """Replay a traffic trace through the pipeline on a virtual clock."""
+    from .faults import ReplayHarness, TrafficTrace
+    setup_logging(log_file)
+
+    trace = TrafficTrace.load(trace_file) if trace_file else TrafficTrace.rate_limit_demo()
+    report = ReplayHarness(trace, retries=retries, seed=seed).run(scenarios=scenarios)
+    click.echo(json.dumps(report, indent=2))
+
 if __name__ == '__main__':
     main()
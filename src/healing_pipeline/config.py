@@ -8,10 +8,34 @@ class Settings(BaseSettings):
     
     TAX_API_BASE_URL: str = "https://api.example.com/v1"
     TAX_API_FAILOVER_URL: Optional[str] = None
+    FAILOVER_PROBE_ENABLED: bool = True
+    FAILOVER_PROBE_TIMEOUT_SECONDS: float = 2.0
+    
+    # Endpoint Health Checks
+    HEALTH_CHECK_ENABLED: bool = True
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 15.0
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+    HEALTH_PROBE_PATH: str = "/"
+    HEALTH_SCORE_ALPHA: float = 0.3
+    HEALTH_MIN_AVAILABILITY: float = 0.5
     
     TAXJAR_API_KEY: Optional[str] = None
     TAXJAR_API_URL: Optional[str] = None
     
+    # Tax Result Cache
+    TAX_CACHE_ENABLED: bool = True
+    TAX_CACHE_DB_PATH: str = "tax_cache.db"
+    TAX_CACHE_MAX_ENTRIES: int = 100000
+    TAX_CACHE_VERSION: str = "1"
+    TAX_RATE_EFFECTIVE_DATE: str = ""  # Set to the current rate table date (e.g. 2026-10-01) to invalidate older entries
+    
+    # Host-wide Shared Cache (plans, error classifications, tax results across worker processes)
+    SHARED_CACHE_ENABLED: bool = True
+    SHARED_CACHE_DIR: str = ""  # Defaults to /dev/shm, else the system temp dir
+    SHARED_CACHE_SLOTS: int = 2048
+    PLAN_CACHE_TTL_SECONDS: float = 3600
+    CLASSIFICATION_TTL_SECONDS: float = 900
+    
     # Ollama Configuration (Local LLM)
     OLLAMA_BASE_URL: str = "http://localhost:11434"
     OLLAMA_MODEL: str = "gemma3:1b"
@@ -19,6 +43,26 @@ class Settings(BaseSettings):
     LLM_MODEL: str = "ollama"
     MAX_RETRIES: int = 3
     
+    # Deadline Budgets (seconds; 0 disables)
+    ORDER_BUDGET_SECONDS: float = 120
+    BATCH_BUDGET_SECONDS: float = 0
+    ATTEMPT_COST_SECONDS: float = 1.0
+    
+    # Fast path: transient errors back off inline instead of going through analyze/heal
+    FAST_PATH_ENABLED: bool = True
+    FAST_PATH_BASE_WAIT_SECONDS: float = 1.0
+    
+    # Dead-Letter Queue
+    DEAD_LETTER_ENABLED: bool = True
+    DEAD_LETTER_DB_PATH: str = "dead_letters.db"
+    
+    # Learned Recovery Policy
+    POLICY_ENABLED: bool = True
+    INCIDENT_DB_PATH: str = "incidents.db"
+    POLICY_MIN_SAMPLES: int = 5
+    POLICY_EPSILON: float = 0.1
+    TRANSIENT_MIN_SUCCESS_RATE: float = 0.5  # Observed retry success rate that marks a signature transient
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -4,6 +4,9 @@ from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.exceptions import OutputParserException
 from ..utils.logging import logger
 from ..config import settings
+from ..utils.shared_cache import get_shared_cache
+from .policy import error_signature
+from .report import report_counter
 from .strategies import StrategyFactory
 import json
 
@@ -15,11 +18,15 @@ MOCK_LLM_RESPONSE = {
 }
 
 class AutomatedWatchdog:
-    def __init__(self):
+    def __init__(self, timeout: float = None):
         self.llm = None
         self.chain = None
         self.using_ollama = False
         
+        if settings.LLM_MODEL.lower() == "mock":
+            logger.info("Watchdog initialized in MOCK mode (LLM_MODEL=mock)")
+            return
+        
         try:
             # Initialize Ollama LLM
             ollama_base_url = settings.OLLAMA_BASE_URL
@@ -28,7 +35,9 @@ class AutomatedWatchdog:
             self.llm = OllamaLLM(
                 base_url=ollama_base_url,
                 model=ollama_model,
-                temperature=0
+                temperature=0,
+                # Bound each call by the caller's remaining deadline budget
+                client_kwargs={"timeout": timeout} if timeout is not None else {}
             )
             
             # Define Parser
@@ -58,14 +67,32 @@ Respond with ONLY the JSON, no other text."""
             logger.warning(f"Failed to initialize Ollama: {e}. Will use MOCK mode.")
             self.using_ollama = False
 
+    @staticmethod
+    def _share_plan(signature: str, plan: dict):
+        """Publish an LLM plan to every worker on this host."""
+        # Transient classifications come from observed retry outcomes (see policy.share_classification), not plans
+        plans = get_shared_cache("plans", ttl_seconds=settings.PLAN_CACHE_TTL_SECONDS)
+        if plans is not None:
+            plans.put(signature, plan)
+
     def analyze_error(self, error: Exception, context: dict) -> dict:
         error_msg = str(error)
         logger.info(f"Watchdog activated. Analyzing error: {error_msg}")
         
+        # Reuse a plan any worker on this host already paid the LLM for
+        signature = error_signature(error_msg, context.get("status_code"))
+        plans = get_shared_cache("plans", ttl_seconds=settings.PLAN_CACHE_TTL_SECONDS)
+        cached_plan = plans.get(signature) if plans is not None else None
+        if cached_plan:
+            report_counter("plan_cache_hits")
+            logger.info(f"✓ Shared plan cache hit ({signature}): {cached_plan}")
+            return cached_plan
+        
         if self.chain and self.using_ollama:
             try:
                 # Invoke Chain and get response
                 response = self.chain.invoke({"error_msg": error_msg, "context": context})
+                report_counter("llm_calls")
                 
                 # Parse JSON from response
                 try:
@@ -80,6 +107,7 @@ Respond with ONLY the JSON, no other text."""
                     
                     plan_json = json.loads(json_str)
                     logger.info(f"✓ Ollama Watchdog Plan: {plan_json}")
+                    self._share_plan(signature, plan_json)
                     return plan_json
                 except json.JSONDecodeError:
                     logger.warning(f"Could not parse JSON response: {response[:100]}")
@@ -94,6 +122,7 @@ Respond with ONLY the JSON, no other text."""
         
         # Fallback to mock
         plan_json = MOCK_LLM_RESPONSE
+        report_counter("mock_plans")
         logger.info(f"Using MOCK Plan: {plan_json}")
         return plan_json
 
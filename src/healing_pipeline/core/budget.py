@@ -0,0 +1,39 @@
+"""Deadline budgeting helpers for per-order and per-batch time limits."""
+from typing import Optional
+
+from ..config import settings
+from ..utils.clock import get_clock
+
+# Shortest timeout handed to a request once the budget is nearly spent
+MIN_TIMEOUT_SECONDS = 0.1
+
+
+def deadline_after(seconds: Optional[float]) -> Optional[float]:
+    """Absolute deadline `seconds` from now, or None for an unbounded budget."""
+    if seconds is None or seconds <= 0:
+        return None
+    return get_clock().time() + seconds
+
+
+def remaining_budget(state: dict) -> Optional[float]:
+    """Seconds left before the tighter of the order and batch deadlines; None if unbounded."""
+    deadlines = [d for d in (state.get('order_deadline'), state.get('batch_deadline')) if d is not None]
+    if not deadlines:
+        return None
+    return min(deadlines) - get_clock().time()
+
+
+def bounded_timeout(timeout: Optional[float], state: dict) -> Optional[float]:
+    """Cap a call's timeout at the remaining budget so a single attempt cannot overrun the deadline."""
+    remaining = remaining_budget(state)
+    if remaining is None:
+        return timeout
+    capped = remaining if timeout is None else min(timeout, remaining)
+    return max(capped, MIN_TIMEOUT_SECONDS)
+
+
+def fits_budget(wait_seconds: float, remaining: Optional[float]) -> bool:
+    """Whether a wait plus one more attempt can complete within the remaining budget."""
+    if remaining is None:
+        return True
+    return wait_seconds + settings.ATTEMPT_COST_SECONDS <= remaining
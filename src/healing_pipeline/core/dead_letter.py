@@ -0,0 +1,99 @@
+"""Persistent dead-letter store for orders that could not be healed."""
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from ..config import settings
+from ..utils.logging import logger
+
+
+class DeadLetterQueue:
+    """SQLite-backed queue of failed orders with their final state and error history."""
+
+    def __init__(self, path: str = None):
+        self.path = path or settings.DEAD_LETTER_DB_PATH
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS dead_letters (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                order_json TEXT,
+                final_state_json TEXT NOT NULL,
+                error_history_json TEXT NOT NULL,
+                status TEXT NOT NULL,
+                error TEXT,
+                created_at REAL NOT NULL,
+                replay_attempts INTEGER NOT NULL DEFAULT 0,
+                resolved_at REAL
+            )"""
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        # TaxJar responses and other objects are not JSON-native; keep their string form
+        return json.dumps(value, default=str)
+
+    def put(self, order: Optional[Dict[str, Any]], final_state: Dict[str, Any]) -> int:
+        """Dead-letter an order and return its entry id."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO dead_letters (order_json, final_state_json, error_history_json, status, error, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self._dumps(order),
+                    self._dumps(final_state),
+                    self._dumps(final_state.get('error_history') or []),
+                    final_state.get('status', 'failed'),
+                    final_state.get('error'),
+                    time.time()
+                )
+            )
+            self._conn.commit()
+        logger.warning(f"Order dead-lettered (#{cursor.lastrowid}) with status: {final_state.get('status')}")
+        return cursor.lastrowid
+
+    def pending(self, limit: int = None) -> List[Dict[str, Any]]:
+        """Unresolved entries, oldest first."""
+        query = "SELECT id, order_json, status, error, replay_attempts FROM dead_letters WHERE resolved_at IS NULL ORDER BY id"
+        params = ()
+        if limit:
+            query += " LIMIT ?"
+            params = (limit,)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {"id": entry_id, "order": json.loads(order_json), "status": status, "error": error, "replay_attempts": attempts}
+            for entry_id, order_json, status, error, attempts in rows
+        ]
+
+    def resolve(self, entry_id: int):
+        """Mark an entry as successfully replayed."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE dead_letters SET resolved_at = ?, replay_attempts = replay_attempts + 1 WHERE id = ?",
+                (time.time(), entry_id)
+            )
+            self._conn.commit()
+
+    def record_failed_replay(self, entry_id: int, final_state: Dict[str, Any]):
+        """Keep an entry pending, refreshing its state after another failed replay."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE dead_letters SET final_state_json = ?, error_history_json = ?, status = ?, error = ?, "
+                "replay_attempts = replay_attempts + 1 WHERE id = ?",
+                (
+                    self._dumps(final_state),
+                    self._dumps(final_state.get('error_history') or []),
+                    final_state.get('status', 'failed'),
+                    final_state.get('error'),
+                    entry_id
+                )
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,46 +1,156 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
 from ..utils.logging import logger
 from ..config import settings
 from ..graph.workflow import create_healing_graph
 from ..graph.state import AgentState
+from .budget import deadline_after, remaining_budget
+from .dead_letter import DeadLetterQueue
+from .health import get_health_checker
+from .report import RunReport, get_active_report, set_active_report
 
 class PipelineEngine:
-    def __init__(self, url: str = None, retries: int = None):
+    def __init__(self, url: str = None, retries: int = None, order_budget: float = None, batch_budget: float = None,
+                 dead_letters: DeadLetterQueue = None, fast_path: bool = None):
         self.base_url = url or settings.TAX_API_BASE_URL
         self.max_retries = retries if retries is not None else settings.MAX_RETRIES
+        self.order_budget = order_budget if order_budget is not None else settings.ORDER_BUDGET_SECONDS
+        self.batch_budget = batch_budget if batch_budget is not None else settings.BATCH_BUDGET_SECONDS
+        self._dead_letters = dead_letters
+        self.last_report: Optional[RunReport] = None
+        # Start probing early so failover decisions have scores ready
+        checker = get_health_checker()
+        if checker is not None:
+            checker.add_endpoint(self.base_url)
         # Ingestor and Watchdog are now instantiated within nodes or passed via context
-        self.graph = create_healing_graph()
-        
-    def run(self):
-        logger.info(f"Starting Pipeline Engine with LangGraph | Max Retries: {self.max_retries}")
-        
+        self.graph = create_healing_graph(fast_path=fast_path)
+
+    @property
+    def dead_letters(self) -> Optional[DeadLetterQueue]:
+        if self._dead_letters is None and settings.DEAD_LETTER_ENABLED:
+            self._dead_letters = DeadLetterQueue()
+        return self._dead_letters
+
+    def _dead_letter(self, order: Optional[Dict[str, Any]], final_state: Dict[str, Any]):
+        try:
+            if self.dead_letters is not None:
+                self.dead_letters.put(order, final_state)
+        except Exception as e:
+            logger.error(f"Failed to dead-letter order: {e}")
+
+    @contextmanager
+    def _reporting(self):
+        """Collect a RunReport for the enclosed run; it is kept as `last_report`."""
+        previous = get_active_report()
+        report = RunReport()
+        set_active_report(report)
+        try:
+            yield report
+        finally:
+            report.finish()
+            set_active_report(previous)
+            self.last_report = report
+
+    def run_order(self, order: Optional[Dict[str, Any]] = None, batch_deadline: float = None,
+                  dead_letter: bool = True) -> AgentState:
+        """
+        Run a single order through the healing graph and return its final state.
+        Unhealed orders are routed to the dead-letter queue unless `dead_letter` is False.
+        """
         # Initial State
         initial_state: AgentState = {
             "retry_count": 0,
             "max_retries": self.max_retries,
             "url": self.base_url,
             "error": None,
+            "error_status": None,
             "plan": None,
             "healing_result": None,
-            "status": "running"
+            "status": "running",
+            "incident": None,
+            "order": order,
+            "order_deadline": deadline_after(self.order_budget),
+            "batch_deadline": batch_deadline,
+            "retry_after": None,
+            "error_history": []
         }
-        
+
+        report = get_active_report()
+        if report is not None:
+            report.begin_order()
+
         try:
             # Execute Graph
-            result_state = self.graph.invoke(initial_state)
-            
-            # Check final status
-            # If state has 'status' key, check it. 
             # Note: invoke returns the final state dict.
-            
-            final_status = result_state.get('status')
-            
-            if final_status == 'success':
-                logger.success(f"Pipeline Completed Successfully.")
-                return True
-            else:
-                logger.error(f"Pipeline Failed with status: {final_status}")
-                return False
-                
+            result_state = self.graph.invoke(initial_state)
         except Exception as e:
             logger.critical(f"Graph Execution Error: {e}")
+            result_state = {
+                **initial_state,
+                "status": "failed",
+                "error": str(e),
+                "error_history": [{"node": "graph", "error": str(e)}]
+            }
+
+        if report is not None:
+            report.end_order(result_state)
+        if dead_letter and result_state.get('status') != 'success':
+            self._dead_letter(order, result_state)
+        return result_state
+
+    def run(self, order: Optional[Dict[str, Any]] = None) -> bool:
+        logger.info(f"Starting Pipeline Engine with LangGraph | Max Retries: {self.max_retries}")
+
+        with self._reporting():
+            final_status = self.run_order(order).get('status')
+
+        if final_status == 'success':
+            logger.success(f"Pipeline Completed Successfully.")
+            return True
+        else:
+            logger.error(f"Pipeline Failed with status: {final_status}")
             return False
+
+    def run_batch(self, orders: Iterable[Dict[str, Any]], dead_letter: bool = True) -> List[AgentState]:
+        """
+        Run orders sequentially under a shared batch deadline.
+        Once the batch budget is spent, remaining orders are failed without being started.
+        """
+        batch_deadline = deadline_after(self.batch_budget)
+        logger.info(f"Starting batch | Max Retries: {self.max_retries} | Batch Budget: {self.batch_budget or 'unbounded'}s")
+
+        results = []
+        with self._reporting() as report:
+            for index, order in enumerate(orders):
+                remaining = remaining_budget({"batch_deadline": batch_deadline})
+                if remaining is not None and remaining <= 0:
+                    logger.error(f"Batch budget exhausted, skipping order #{index + 1}")
+                    skipped = {"order": order, "status": "deadline_exceeded", "error": "Batch budget exhausted", "error_history": []}
+                    if dead_letter:
+                        self._dead_letter(order, skipped)
+                    report.end_order(skipped)
+                    results.append(skipped)
+                    continue
+                results.append(self.run_order(order, batch_deadline=batch_deadline, dead_letter=dead_letter))
+
+        succeeded = sum(1 for r in results if r.get('status') == 'success')
+        logger.info(f"Batch finished | {succeeded}/{len(results)} orders succeeded")
+        return results
+
+    def replay_dead_letters(self, limit: int = None) -> List[AgentState]:
+        """Feed pending dead-lettered orders back through the graph as one batch."""
+        if self.dead_letters is None:
+            logger.warning("Dead-letter queue is disabled; nothing to replay.")
+            return []
+
+        entries = self.dead_letters.pending(limit)
+        logger.info(f"Replaying {len(entries)} dead-lettered orders")
+        results = self.run_batch([entry['order'] for entry in entries], dead_letter=False)
+
+        for entry, result in zip(entries, results):
+            if result.get('status') == 'success':
+                self.dead_letters.resolve(entry['id'])
+            else:
+                self.dead_letters.record_failed_replay(entry['id'], result)
+        return results
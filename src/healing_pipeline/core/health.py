@@ -0,0 +1,151 @@
+"""Background health probing of the primary and failover API endpoints."""
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+from ..config import settings
+from ..utils.http import get_session
+from ..utils.logging import logger
+
+
+class EndpointHealth:
+    """Exponentially weighted availability and latency for one endpoint."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.availability: Optional[float] = None
+        self.latency: Optional[float] = None
+        self.last_checked: Optional[float] = None
+
+    def update(self, up: bool, latency: float, alpha: float):
+        sample = 1.0 if up else 0.0
+        if self.availability is None:
+            self.availability, self.latency = sample, latency
+        else:
+            self.availability = alpha * sample + (1 - alpha) * self.availability
+            self.latency = alpha * latency + (1 - alpha) * self.latency
+        self.last_checked = time.time()
+
+    @property
+    def score(self) -> float:
+        """Higher is better: availability discounted by latency in seconds."""
+        if self.availability is None:
+            return 0.0
+        return self.availability / (1.0 + self.latency)
+
+    def as_dict(self) -> dict:
+        return {"url": self.url, "availability": self.availability, "latency": self.latency, "score": self.score}
+
+
+class EndpointHealthChecker:
+    """
+    Periodically probes endpoints on a daemon thread.
+    Probes go through the shared HTTP session, so they also keep its connection pools warm.
+    """
+
+    def __init__(self, endpoints: Iterable[str] = (), interval: float = None, session: requests.Session = None):
+        self.interval = interval if interval is not None else settings.HEALTH_CHECK_INTERVAL_SECONDS
+        self.session = session
+        self._health: Dict[str, EndpointHealth] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        for url in endpoints:
+            self.add_endpoint(url)
+
+    def add_endpoint(self, url: Optional[str]):
+        if not url:
+            return
+        with self._lock:
+            self._health.setdefault(url.rstrip("/"), EndpointHealth(url.rstrip("/")))
+
+    def probe(self, url: str) -> bool:
+        """Probe one endpoint and fold the result into its score."""
+        session = self.session or get_session()
+        started = time.monotonic()
+        try:
+            response = session.get(f"{url}{settings.HEALTH_PROBE_PATH}", timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS)
+            # Rate-limited endpoints are reachable but not usable right now
+            up = response.status_code < 500 and response.status_code != 429
+        except requests.RequestException:
+            up = False
+        latency = time.monotonic() - started
+        with self._lock:
+            health = self._health.setdefault(url, EndpointHealth(url))
+            health.update(up, latency, settings.HEALTH_SCORE_ALPHA)
+        return up
+
+    def probe_all(self):
+        for url in self.endpoints():
+            self.probe(url)
+
+    def endpoints(self) -> List[str]:
+        with self._lock:
+            return list(self._health)
+
+    def snapshot(self) -> List[dict]:
+        with self._lock:
+            return [h.as_dict() for h in self._health.values()]
+
+    def is_healthy(self, url: str) -> Optional[bool]:
+        """True/False once probed; None if the endpoint has no probe history yet."""
+        with self._lock:
+            health = self._health.get(url.rstrip("/"))
+            if health is None or health.availability is None:
+                return None
+            return health.availability >= settings.HEALTH_MIN_AVAILABILITY
+
+    def best_endpoint(self, exclude: Optional[str] = None) -> Optional[str]:
+        """Healthiest probed endpoint above the availability threshold, optionally excluding one."""
+        exclude = exclude.rstrip("/") if exclude else None
+        with self._lock:
+            candidates = [
+                h for url, h in self._health.items()
+                if url != exclude and h.availability is not None and h.availability >= settings.HEALTH_MIN_AVAILABILITY
+            ]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda h: h.score).url
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.probe_all()
+            except Exception as e:
+                logger.warning(f"Health probe cycle failed: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="endpoint-health", daemon=True)
+        self._thread.start()
+        logger.info(f"Endpoint health checker started for {self.endpoints()} (every {self.interval}s)")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS + 1)
+            self._thread = None
+
+
+_checker: Optional[EndpointHealthChecker] = None
+_checker_lock = threading.Lock()
+
+
+def get_health_checker(start: bool = True) -> Optional[EndpointHealthChecker]:
+    """
+    Process-wide checker for the configured endpoints; None when disabled.
+    With start=False an existing checker is returned but none is created.
+    """
+    global _checker
+    if not settings.HEALTH_CHECK_ENABLED:
+        return None
+    with _checker_lock:
+        if _checker is None and start:
+            _checker = EndpointHealthChecker([settings.TAX_API_BASE_URL, settings.TAX_API_FAILOVER_URL])
+            _checker.start()
+        return _checker
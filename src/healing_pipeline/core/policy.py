@@ -0,0 +1,237 @@
+"""Learned recovery policy backed by historical incident outcomes."""
+import random
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ..config import settings
+from ..utils.logging import logger
+from ..utils.shared_cache import get_shared_cache
+
+# Candidate (action, base wait) pairs the policy chooses between
+RETRY_WAITS = (0.5, 1.0, 2.0, 4.0)
+
+# Signatures that are worth a plain backoff without consulting the analyzer
+TRANSIENT_SIGNATURES = {"http_408", "http_429", "http_502", "http_503", "http_504"}
+_TRANSIENT_MARKERS = (
+    "timed out", "timeout", "connection reset", "connection aborted", "connection refused", "temporarily unavailable"
+)
+
+# Only the prefix raise_for_status() produces; other 3-digit numbers may be ports (e.g. port=443)
+_STATUS_RE = re.compile(r"\s*([45]\d\d) (?:Client|Server) Error\b")
+_URL_RE = re.compile(r"\w+://\S+")
+_NUMBER_RE = re.compile(r"\d+(\.\d+)?")
+
+
+def error_signature(error: Optional[str], status_code: Optional[int] = None) -> str:
+    """
+    Normalizes an error message into a stable signature.
+    HTTP errors collapse to their status code (taken from the response when known);
+    anything else, including connection-level timeouts and refusals, drops URLs and numbers.
+    """
+    if status_code:
+        return f"http_{status_code}"
+    if not error:
+        return "unknown"
+    match = _STATUS_RE.match(error)
+    if match:
+        return f"http_{match.group(1)}"
+    text = _URL_RE.sub("<url>", error.lower())
+    text = " ".join(_NUMBER_RE.sub("<n>", text).split())
+    # Connection-level messages are long; lead with the transient marker so truncation keeps it
+    marker = next((m for m in _TRANSIENT_MARKERS if m in text), None)
+    if marker:
+        text = f"{marker}: {text}"
+    return text[:80]
+
+
+def _is_client_error(signature: str) -> bool:
+    # 4xx responses won't change on retry, except timeouts and rate limits
+    return signature.startswith("http_4") and signature not in TRANSIENT_SIGNATURES
+
+
+def _classifications():
+    return get_shared_cache("classifications", ttl_seconds=settings.CLASSIFICATION_TTL_SECONDS)
+
+
+def is_transient(signature: str) -> bool:
+    """
+    Whether an error signature is a known-transient failure (rate limits, gateway errors, timeouts),
+    either built in or learned from retry outcomes observed by any worker on this host.
+    """
+    if signature in TRANSIENT_SIGNATURES or any(marker in signature for marker in _TRANSIENT_MARKERS):
+        return True
+    if _is_client_error(signature):
+        return False
+    classifications = _classifications()
+    if classifications is None:
+        return False
+    classification = classifications.get(signature)
+    return bool(classification and classification.get("transient"))
+
+
+def share_classification(store: "IncidentStore", signature: str):
+    """
+    Publish whether retries of `signature` mostly succeed, once enough outcomes exist.
+    Refreshed on every recorded retry, so a signature that stops healing drops off the fast path.
+    """
+    if _is_client_error(signature):
+        return
+    classifications = _classifications()
+    if classifications is None:
+        return
+    retries = [stats for (action, _), stats in store.arm_stats(signature).items() if action == "RETRY"]
+    attempts = sum(stats["attempts"] for stats in retries)
+    if attempts < settings.POLICY_MIN_SAMPLES:
+        return
+    successes = sum(stats["successes"] for stats in retries)
+    classifications.put(signature, {
+        "transient": successes / attempts >= settings.TRANSIENT_MIN_SUCCESS_RATE,
+        "attempts": attempts,
+        "successes": successes
+    })
+
+
+class IncidentStore:
+    """SQLite store of recovery attempts and their outcomes."""
+
+    def __init__(self, path: str = None):
+        self.path = path or settings.INCIDENT_DB_PATH
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS incidents (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                signature TEXT NOT NULL,
+                action TEXT NOT NULL,
+                wait_seconds REAL NOT NULL,
+                success INTEGER NOT NULL,
+                elapsed_seconds REAL NOT NULL,
+                recorded_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_incidents_signature ON incidents(signature)"
+        )
+        self._conn.commit()
+
+    def record(self, signature: str, action: str, wait_seconds: float, success: bool, elapsed_seconds: float):
+        """Record the outcome of a single recovery attempt."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO incidents (signature, action, wait_seconds, success, elapsed_seconds, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (signature, action.upper(), float(wait_seconds), int(bool(success)), float(elapsed_seconds), time.time())
+            )
+            self._conn.commit()
+
+    def arm_stats(self, signature: str) -> Dict[Tuple[str, float], Dict[str, float]]:
+        """Aggregate attempts, successes and elapsed time per (action, wait) for a signature."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT action, wait_seconds, COUNT(*), SUM(success), SUM(elapsed_seconds) "
+                "FROM incidents WHERE signature = ? GROUP BY action, wait_seconds",
+                (signature,)
+            ).fetchall()
+        return {
+            (action, wait): {"attempts": attempts, "successes": successes or 0, "elapsed": elapsed or 0.0}
+            for action, wait, attempts, successes, elapsed in rows
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RecoveryPolicy:
+    """
+    Epsilon-greedy bandit over (action, base wait) arms.
+    Each arm is scored by successes per second spent healing for the given error signature.
+    Returns None until enough history exists, so the caller can fall back to the LLM.
+    """
+
+    def __init__(self, store: IncidentStore, min_samples: int = None, epsilon: float = None, rng: random.Random = None):
+        self.store = store
+        self.min_samples = min_samples if min_samples is not None else settings.POLICY_MIN_SAMPLES
+        self.epsilon = epsilon if epsilon is not None else settings.POLICY_EPSILON
+        self.rng = rng or random.Random()
+
+    @staticmethod
+    def arms(allow_failover: bool = True) -> List[Tuple[str, float]]:
+        arms = [("RETRY", wait) for wait in RETRY_WAITS]
+        if allow_failover:
+            arms.append(("FAILOVER", 0.0))
+        return arms
+
+    @staticmethod
+    def arm_for(action: str, wait_seconds: float) -> Tuple[str, float]:
+        """
+        Map a committed action and base wait onto the arm its outcome is scored under.
+        FAILOVER has no wait, and retries snap to the nearest known wait so LLM plans count too.
+        """
+        action = action.upper().strip()
+        if action == "FAILOVER":
+            return action, 0.0
+        if action == "RETRY":
+            return action, min(RETRY_WAITS, key=lambda wait: abs(wait - float(wait_seconds or 0)))
+        return action, float(wait_seconds or 0)
+
+    @staticmethod
+    def score(stats: Dict[str, float]) -> float:
+        """Successes per second; a small floor keeps instant outcomes from dividing by zero."""
+        return stats["successes"] / max(stats["elapsed"], 0.1)
+
+    def select(self, signature: str, allow_failover: bool = True, max_wait: float = None) -> Optional[dict]:
+        stats = self.store.arm_stats(signature)
+        arms = [arm for arm in self.arms(allow_failover) if max_wait is None or arm[1] <= max_wait]
+        if not arms:
+            return None
+        known = {arm: s for arm, s in stats.items() if arm in arms}
+        if sum(s["attempts"] for s in known.values()) < self.min_samples:
+            return None
+
+        if self.rng.random() < self.epsilon:
+            action, wait = self.rng.choice(arms)
+            rationale = "Exploring alternative recovery arm"
+        else:
+            (action, wait), best = max(known.items(), key=lambda item: self.score(item[1]))
+            rationale = (
+                f"Learned policy: {best['successes']}/{best['attempts']} successes, "
+                f"{self.score(best):.3f} successes/sec"
+            )
+
+        return {
+            "error_category": signature,
+            "recovery_action": action,
+            "wait_seconds": wait,
+            "rationale": rationale,
+            "source": "policy"
+        }
+
+
+_policy: Optional[RecoveryPolicy] = None
+
+
+def get_policy(create: bool = True) -> Optional[RecoveryPolicy]:
+    """
+    Lazily create the process-wide policy; returns None when disabled or unavailable.
+    With create=False an installed policy is returned but none is created.
+    """
+    global _policy
+    if not settings.POLICY_ENABLED:
+        return None
+    if _policy is None and create:
+        try:
+            _policy = RecoveryPolicy(IncidentStore())
+        except sqlite3.Error as e:
+            logger.warning(f"Incident store unavailable ({e}). Policy disabled.")
+            return None
+    return _policy
+
+
+def set_policy(policy: Optional[RecoveryPolicy]):
+    """Install a policy process-wide (e.g. one backed by an in-memory store); None resets it."""
+    global _policy
+    _policy = policy
@@ -0,0 +1,208 @@
+"""Structured run report: throughput, per-node latency and healing statistics."""
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from ..utils.logging import logger
+
+# Upper bounds (ms) of the node latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# Counters every report carries, even when zero
+COUNTERS = (
+    "llm_calls",              # Plans produced by the Ollama Watchdog
+    "mock_plans",             # Watchdog fell back to the built-in mock plan
+    "plan_cache_hits",        # LLM plans reused from the host-wide shared cache
+    "policy_plans",           # Plans served by the learned recovery policy
+    "fast_path_retries",      # Transient failures handled by the backoff fast path
+    "taxjar_calls",           # Live TaxJar requests
+    "taxjar_calls_avoided",   # Tax results served from the result cache
+    "failovers",              # Endpoint switches (strategy or health-based)
+)
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class RunReport:
+    """Collects metrics for one engine run; nodes report into the active instance."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.finished_at: Optional[float] = None
+        self.wall_seconds = 0.0
+        self.node_latencies: Dict[str, List[float]] = {}
+        self.counters: Dict[str, float] = {name: 0 for name in COUNTERS}
+        self.backoff_seconds = 0.0
+        self.orders: List[Dict[str, Any]] = []
+        self._order: Optional[Dict[str, Any]] = None
+
+    def record_node(self, node: str, seconds: float):
+        self.node_latencies.setdefault(node, []).append(seconds)
+
+    def increment(self, counter: str, amount: float = 1):
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+        if self._order is not None:
+            self._order[counter] = self._order.get(counter, 0) + amount
+
+    def add_backoff(self, seconds: float):
+        self.backoff_seconds += seconds
+        if self._order is not None:
+            self._order["backoff_seconds"] += seconds
+
+    def begin_order(self):
+        self._order = {"started": time.perf_counter(), "backoff_seconds": 0.0}
+
+    def end_order(self, final_state: Dict[str, Any]):
+        order = self._order or {"started": time.perf_counter(), "backoff_seconds": 0.0}
+        self.orders.append({
+            "status": final_state.get('status'),
+            "retries": final_state.get('retry_count', 0),
+            "failovers": order.get("failovers", 0),
+            "backoff_seconds": round(order["backoff_seconds"], 3),
+            "seconds": time.perf_counter() - order["started"]
+        })
+        self._order = None
+
+    def finish(self):
+        self.finished_at = time.time()
+        self.wall_seconds = time.perf_counter() - self._started
+
+    @staticmethod
+    def _latency_summary(samples: List[float]) -> Dict[str, Any]:
+        values = sorted(s * 1000 for s in samples)
+        histogram = {f"<={bound}ms": 0 for bound in LATENCY_BUCKETS_MS}
+        histogram[f">{LATENCY_BUCKETS_MS[-1]}ms"] = 0
+        for value in values:
+            bucket = next((f"<={b}ms" for b in LATENCY_BUCKETS_MS if value <= b), f">{LATENCY_BUCKETS_MS[-1]}ms")
+            histogram[bucket] += 1
+        return {
+            "count": len(values),
+            "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+            "p50_ms": round(_percentile(values, 50), 3),
+            "p95_ms": round(_percentile(values, 95), 3),
+            "max_ms": round(values[-1], 3) if values else 0.0,
+            "histogram": histogram
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        processed = len(self.orders)
+        succeeded = sum(1 for o in self.orders if o["status"] == 'success')
+        retries = [o["retries"] for o in self.orders]
+        failovers = [o["failovers"] for o in self.orders]
+        return {
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "orders_processed": processed,
+            "orders_succeeded": succeeded,
+            "success_rate": round(succeeded / processed, 4) if processed else 0.0,
+            "orders_per_second": round(processed / self.wall_seconds, 3) if self.wall_seconds else 0.0,
+            "retries": {
+                "total": sum(retries),
+                "per_order_mean": round(sum(retries) / processed, 3) if processed else 0.0,
+                "per_order_max": max(retries, default=0)
+            },
+            "failovers": {
+                "total": sum(failovers),
+                "per_order_mean": round(sum(failovers) / processed, 3) if processed else 0.0,
+                "per_order_max": max(failovers, default=0)
+            },
+            "backoff_seconds": round(self.backoff_seconds, 3),
+            "counters": dict(self.counters),
+            "node_latency": {node: self._latency_summary(s) for node, s in sorted(self.node_latencies.items())},
+            "orders": [{**o, "seconds": round(o["seconds"], 4)} for o in self.orders]
+        }
+
+    def write_json(self, path: str) -> Dict[str, Any]:
+        data = self.to_dict()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        logger.info(f"Run report written to {path}")
+        return data
+
+
+def compare_reports(current: Dict[str, Any], previous: Dict[str, Any], tolerance: float = 0.1) -> List[str]:
+    """
+    List regressions of `current` against `previous`.
+    Throughput and success rate may not drop, and per-order cost (retries, backoff, LLM calls,
+    TaxJar calls) and node p95 latency may not grow, by more than `tolerance` (relative).
+    """
+    regressions = []
+
+    def _worse(name: str, now: float, before: float, higher_is_better: bool):
+        if not before:
+            return
+        change = (now - before) / before
+        if (higher_is_better and change < -tolerance) or (not higher_is_better and change > tolerance):
+            regressions.append(f"{name}: {before} -> {now} ({change:+.1%})")
+
+    _worse("orders_per_second", current.get("orders_per_second", 0), previous.get("orders_per_second", 0), True)
+    _worse("success_rate", current.get("success_rate", 0), previous.get("success_rate", 0), True)
+
+    def _per_order(report: Dict[str, Any], value: float) -> float:
+        processed = report.get("orders_processed") or 0
+        return round(value / processed, 4) if processed else 0.0
+
+    _worse("retries per order", current.get("retries", {}).get("per_order_mean", 0),
+           previous.get("retries", {}).get("per_order_mean", 0), False)
+    _worse("backoff seconds per order", _per_order(current, current.get("backoff_seconds", 0)),
+           _per_order(previous, previous.get("backoff_seconds", 0)), False)
+    for counter in ("llm_calls", "taxjar_calls"):
+        _worse(f"{counter} per order", _per_order(current, current.get("counters", {}).get(counter, 0)),
+               _per_order(previous, previous.get("counters", {}).get(counter, 0)), False)
+
+    for node, stats in current.get("node_latency", {}).items():
+        before = previous.get("node_latency", {}).get(node)
+        if before:
+            _worse(f"{node} p95_ms", stats["p95_ms"], before["p95_ms"], False)
+
+    return regressions
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+_active: Optional[RunReport] = None
+
+
+def get_active_report() -> Optional[RunReport]:
+    return _active
+
+
+def set_active_report(report: Optional[RunReport]):
+    global _active
+    _active = report
+
+
+def report_counter(counter: str, amount: float = 1):
+    """Increment a counter on the active report, if any."""
+    if _active is not None:
+        _active.increment(counter, amount)
+
+
+def report_backoff(seconds: float):
+    """Add backoff sleep time to the active report, if any."""
+    if _active is not None:
+        _active.add_backoff(seconds)
+
+
+def timed_node(name: str, node):
+    """Wrap a graph node so its latency is recorded on the active report."""
+    def wrapper(state):
+        started = time.perf_counter()
+        try:
+            return node(state)
+        finally:
+            if _active is not None:
+                _active.record_node(name, time.perf_counter() - started)
+    wrapper.__name__ = getattr(node, "__name__", name)
+    wrapper.__doc__ = getattr(node, "__doc__", None)
+    return wrapper
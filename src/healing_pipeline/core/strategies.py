@@ -1,10 +1,22 @@
 from abc import ABC, abstractmethod
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib.metadata import entry_points
+from typing import List, Type
+import threading
+import requests
+from ..config import settings
+from ..utils.clock import get_clock
+from ..utils.http import get_session
 from ..utils.logging import logger, log_healed_incident, log_hard_failure
+from .health import get_health_checker
+from .report import report_backoff
 
 class RecoveryStrategy(ABC):
     """Abstract base class for recovery strategies."""
     
+    # Terminal strategies end the healing loop and only run once every other option has failed
+    terminal = False
+    
     @abstractmethod
     def execute(self, context: dict):
         """Execute the recovery strategy."""
@@ -13,61 +25,192 @@ class RecoveryStrategy(ABC):
 class RetryStrategy(RecoveryStrategy):
     """Implements exponential backoff retry logic."""
     
-    def execute(self, context: dict):
+    MAX_WAIT_SECONDS = 60
+
+    @classmethod
+    def backoff_seconds(cls, context: dict) -> float:
+        """Exponential backoff with simple cap."""
         base_wait = float(context.get('wait_seconds', 1))
         retry_count = int(context.get('retry_count', 0))
-        # Exponential backoff with simple cap
-        wait_seconds = min(base_wait * (2 ** retry_count), 60)
+        return min(base_wait * (2 ** min(retry_count, 16)), cls.MAX_WAIT_SECONDS)
+
+    def execute(self, context: dict):
+        retry_count = int(context.get('retry_count', 0))
+        wait_seconds = self.backoff_seconds(context)
         rationale = context.get('rationale', 'Retry initiated')
         logger.info(f"Strategy: RETRY | Wait: {wait_seconds}s | Rationale: {rationale} | retry_count: {retry_count}")
-        time.sleep(wait_seconds)
+        cancel_event = context.get('cancel_event')
+        if cancel_event is not None:
+            # Running inside a composite: another action may win before the backoff elapses
+            if get_clock().wait(cancel_event, wait_seconds):
+                logger.info("Strategy: RETRY | Cancelled, another recovery action succeeded first")
+                return False
+        else:
+            get_clock().sleep(wait_seconds)
+        report_backoff(wait_seconds)
         log_healed_incident("TaxDataIngestor", "RETRY", f"Waited {wait_seconds}s (retry {retry_count})")
         return True
 
 class FailoverStrategy(RecoveryStrategy):
-    """Switches to a backup API endpoint."""
+    """Switches to a backup API endpoint, preferring the healthiest one the health checker knows."""
     
     def execute(self, context: dict):
         rationale = context.get('rationale', 'Failover initiated')
         backup_url = context.get('failover_url')
+        checker = get_health_checker(start=False)
+        
+        healthy = None
+        if checker is not None:
+            best = checker.best_endpoint(exclude=context.get('current_url'))
+            if best:
+                backup_url = best
+            healthy = checker.is_healthy(backup_url) if backup_url else None
         
         if not backup_url:
             logger.error("Failover requested but no backup URL provided in context.")
             return False
+        
+        if healthy is False:
+            logger.warning(f"Strategy: FAILOVER | Backup {backup_url} reported unhealthy, not switching")
+            return False
+        
+        # Only probe inline when the health checker has no opinion yet
+        if context.get('probe') and settings.FAILOVER_PROBE_ENABLED and healthy is None and not self.probe(backup_url):
+            logger.warning(f"Strategy: FAILOVER | Backup {backup_url} unreachable, not switching")
+            return False
             
         logger.warning(f"Strategy: FAILOVER | Switch to: {backup_url} | Rationale: {rationale}")
         log_healed_incident("TaxDataIngestor", "FAILOVER", f"Switched to {backup_url}")
         return {"action": "update_url", "url": backup_url}
 
+    @staticmethod
+    def probe(url: str) -> bool:
+        """Cheap reachability check; any non-5xx response counts as reachable."""
+        try:
+            response = get_session().get(url, timeout=settings.FAILOVER_PROBE_TIMEOUT_SECONDS)
+            return response.status_code < 500
+        except requests.RequestException:
+            return False
+
 class EscalateStrategy(RecoveryStrategy):
-    """Escalates the error and stops execution."""
+    """Escalates the error; the engine routes the order to the dead-letter queue."""
+    
+    terminal = True
     
     def execute(self, context: dict):
         rationale = context.get('rationale', 'Escalation initiated')
         logger.critical(f"Strategy: ESCALATE | Rationale: {rationale}")
         log_hard_failure("TaxDataIngestor", f"Escalated due to: {rationale}")
-        raise SystemExit("Manual intervention required.")
+        return {"action": "escalate", "reason": rationale}
+
+class CompositeStrategy(RecoveryStrategy):
+    """
+    Runs several recovery actions concurrently and commits whichever succeeds first.
+    E.g. for "RETRY | FAILOVER" the failover endpoint is probed while the retry backoff is pending.
+    Terminal members (ESCALATE) only run if every concurrent member fails.
+    """
+    
+    def __init__(self, members: List[tuple]):
+        self.members = [(name, strategy) for name, strategy in members if not strategy.terminal]
+        self.fallbacks = [(name, strategy) for name, strategy in members if strategy.terminal]
+        self.winner = None
+    
+    def execute(self, context: dict):
+        cancel_event = threading.Event()
+        member_context = {**context, "cancel_event": cancel_event, "probe": True}
+        logger.info(f"Strategy: COMPOSITE | Racing: {', '.join(name for name, _ in self.members)}")
+        
+        executor = ThreadPoolExecutor(max_workers=max(len(self.members), 1))
+        try:
+            futures = {executor.submit(strategy.execute, member_context): name for name, strategy in self.members}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"Strategy: COMPOSITE | {futures[future]} raised {e}")
+                    continue
+                if result:
+                    self.winner = futures[future]
+                    cancel_event.set()
+                    logger.info(f"Strategy: COMPOSITE | Committed {self.winner}")
+                    return result
+        finally:
+            cancel_event.set()
+            # Don't block on losers (e.g. an in-flight probe); they observe the cancel event
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        for name, strategy in self.fallbacks:
+            self.winner = name
+            return strategy.execute(context)
+        return False
 
 class StrategyFactory:
-    """Factory to get the appropriate strategy."""
+    """
+    Registry of recovery strategies.
+    Built-ins are registered below; plugins register via the `healing_pipeline.strategies`
+    entry point group (name -> RecoveryStrategy subclass) or `StrategyFactory.register`.
+    """
+    
+    ENTRY_POINT_GROUP = "healing_pipeline.strategies"
     
     _strategies = {
         "RETRY": RetryStrategy,
         "FAILOVER": FailoverStrategy,
         "ESCALATE": EscalateStrategy
     }
+    _plugins_loaded = False
+    
+    @classmethod
+    def register(cls, name: str, strategy_class: Type[RecoveryStrategy] = None):
+        """Register a strategy class; usable directly or as a class decorator."""
+        def decorator(klass: Type[RecoveryStrategy]):
+            if not (isinstance(klass, type) and issubclass(klass, RecoveryStrategy)):
+                raise TypeError(f"{klass!r} is not a RecoveryStrategy")
+            cls._strategies[name.upper().strip()] = klass
+            return klass
+        if strategy_class is not None:
+            return decorator(strategy_class)
+        return decorator
+    
+    @classmethod
+    def load_plugins(cls):
+        """Register strategies published by installed packages (once per process)."""
+        if cls._plugins_loaded:
+            return
+        cls._plugins_loaded = True
+        for entry_point in entry_points(group=cls.ENTRY_POINT_GROUP):
+            try:
+                cls.register(entry_point.name, entry_point.load())
+                logger.info(f"Loaded recovery strategy plugin: {entry_point.name}")
+            except Exception as e:
+                logger.warning(f"Failed to load strategy plugin {entry_point.name}: {e}")
+    
+    @classmethod
+    def available(cls) -> List[str]:
+        cls.load_plugins()
+        return sorted(cls._strategies)
+    
+    @staticmethod
+    def parse_actions(action_name: str) -> List[str]:
+        """Split a plan action such as "RETRY | FAILOVER" into unique names, keeping order."""
+        actions = []
+        for action in action_name.upper().split("|"):
+            action = action.strip()
+            if action and action not in actions:
+                actions.append(action)
+        return actions
     
     @classmethod
     def get_strategy(cls, action_name: str) -> RecoveryStrategy:
+        cls.load_plugins()
         # Handle cases where action contains multiple options (e.g., "RETRY | FAILOVER | ESCALATE")
-        action_name = action_name.upper().strip()
-        
-        # If multiple options separated by |, pick the first one
-        if "|" in action_name:
-            actions = [a.strip() for a in action_name.split("|")]
-            action_name = actions[0]  # Use first suggested action
+        actions = cls.parse_actions(action_name)
+        known = [a for a in actions if a in cls._strategies]
+        for unknown in set(actions) - set(known):
+            logger.warning(f"Ignoring unknown recovery strategy: {unknown}")
         
-        strategy_class = cls._strategies.get(action_name)
-        if strategy_class:
-            return strategy_class()
-        raise ValueError(f"Unknown recovery strategy: {action_name}")
+        if not known:
+            raise ValueError(f"Unknown recovery strategy: {action_name}")
+        if len(known) == 1:
+            return cls._strategies[known[0]]()
+        return CompositeStrategy([(name, cls._strategies[name]()) for name in known])
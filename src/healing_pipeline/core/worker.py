@@ -1,49 +1,35 @@
 import requests
+from ..utils.http import get_session
 from ..utils.logging import logger
 
+# Default per-request timeout; callers with a deadline pass a tighter one
+REQUEST_TIMEOUT_SECONDS = 10
+
 class TaxDataIngestor:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, session: requests.Session = None):
         self.base_url = base_url
+        # Shared session keeps connections warmed by the health checker
+        self.session = session or get_session()
         self.request_count = 0
-        self._simulate_failure = True 
 
-    def execute_ingestion(self, endpoint: str = "/todos/1", headers: dict = None):
+    def execute_ingestion(self, endpoint: str = "/todos/1", headers: dict = None, timeout: float = REQUEST_TIMEOUT_SECONDS):
         """
-        Simulates an API call.
-        Intentionally fails with 429 on the first few attempts to demonstrate self-healing.
-        Then proceeds to make a REAL network call.
+        Fetches data from the API.
+        Failures are raised to the graph for healing; use `healing_pipeline.faults`
+        to inject them deterministically.
         """
         self.request_count += 1
         url = f"{self.base_url}{endpoint}"
         
         logger.info(f"Attempting ingestion Request #{self.request_count} to {url}")
 
-        # Simulation Logic: Fail on the 1st attempt
-        if self._simulate_failure and self.request_count == 1:
-            logger.warning("Simulating 429 Rate Limit Error...")
-            # Create a mock response object
-            mock_response = requests.Response()
-            mock_response.status_code = 429
-            # mock_response.headers = {'Retry-After': '2'}
-            mock_response._content = b'{"error": "Too Many Requests"}'
-            
-            error = requests.exceptions.HTTPError("429 Client Error: Too Many Requests")
-            error.response = mock_response
-            error.request = requests.Request('GET', url, headers=headers).prepare()
-            
-            # Disable failure for next time to show healing
-            self._simulate_failure = False 
-            raise error
-
-        # Real Network Call
         try:
-            logger.info("Executing REAL network request...")
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
             data = response.json()
             logger.info("API Call Successful. Data Ingested.")
             return {"status": "success", "data": data}
         except Exception as e:
-            logger.error(f"Real network request failed: {e}")
+            logger.error(f"Network request failed: {e}")
             raise e
 
@@ -0,0 +1,3 @@
+from .trace import CONNECTION_ERROR, TIMEOUT, TraceEvent, TrafficTrace, RecordingSession
+from .session import FaultInjectingSession
+from .harness import ReplayHarness
@@ -0,0 +1,97 @@
+"""Replay harness: runs many healing scenarios against a traffic trace on a virtual clock."""
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from ..config import settings
+from ..core.dead_letter import DeadLetterQueue
+from ..core.engine import PipelineEngine
+from ..core.policy import IncidentStore, RecoveryPolicy, get_policy, set_policy
+from ..utils.clock import VirtualClock, get_clock, set_clock
+from ..utils.http import get_session, set_session
+from ..utils.logging import logger
+from .session import FaultInjectingSession
+from .trace import TrafficTrace
+
+# Replays must never reach Ollama, TaxJar or the live health probes.
+# Inline failover probes are off too: they would consume trace events meant for ingestion.
+REPLAY_SETTINGS = {
+    "LLM_MODEL": "mock",
+    "TAXJAR_API_KEY": None,
+    "HEALTH_CHECK_ENABLED": False,
+    "FAILOVER_PROBE_ENABLED": False,
+    "TAX_CACHE_ENABLED": False,
+    "SHARED_CACHE_ENABLED": False
+}
+
+
+@contextmanager
+def _overridden_settings(overrides: Dict[str, Any]):
+    previous = {key: getattr(settings, key) for key in overrides}
+    try:
+        for key, value in overrides.items():
+            setattr(settings, key, value)
+        yield
+    finally:
+        for key, value in previous.items():
+            setattr(settings, key, value)
+
+
+class ReplayHarness:
+    """
+    Replays a traffic trace through PipelineEngine once per scenario.
+    The HTTP session, clock, policy and dead-letter store are swapped for local stand-ins,
+    so backoff waits cost no real time and nothing is persisted.
+    The policy's exploration is seeded with `seed`, so identical runs give identical reports.
+    """
+
+    def __init__(self, trace: TrafficTrace, retries: int = None, policy: RecoveryPolicy = None, seed: int = 0,
+                 **engine_kwargs):
+        self.trace = trace
+        self.retries = retries
+        self.policy = policy
+        self.seed = seed
+        self.engine_kwargs = engine_kwargs
+
+    def run(self, scenarios: int = 1, order: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        clock = VirtualClock(start=time.time())
+        session = FaultInjectingSession(self.trace, clock)
+        previous = (get_clock(), get_session(), get_policy(create=False))
+        set_clock(clock)
+        set_session(session)
+        set_policy(self.policy or RecoveryPolicy(IncidentStore(":memory:"), rng=random.Random(self.seed)))
+
+        statuses: Dict[str, int] = {}
+        retries = 0
+        started = time.perf_counter()
+        try:
+            with _overridden_settings(REPLAY_SETTINGS):
+                engine = PipelineEngine(
+                    retries=self.retries,
+                    dead_letters=DeadLetterQueue(":memory:"),
+                    **self.engine_kwargs
+                )
+                for _ in range(scenarios):
+                    session.reset()
+                    result = engine.run_order(order)
+                    statuses[result.get('status')] = statuses.get(result.get('status'), 0) + 1
+                    retries += result.get('retry_count', 0)
+        finally:
+            set_clock(previous[0])
+            set_session(previous[1])
+            set_policy(previous[2])
+
+        wall_seconds = time.perf_counter() - started
+        report = {
+            "scenarios": scenarios,
+            "statuses": statuses,
+            "success_rate": statuses.get('success', 0) / scenarios if scenarios else 0.0,
+            "retries": retries,
+            "requests": session.requests_served,
+            "virtual_seconds": round(clock.slept, 3),
+            "wall_seconds": round(wall_seconds, 3),
+            "scenarios_per_minute": round(scenarios / wall_seconds * 60, 1) if wall_seconds else None
+        }
+        logger.info(f"Replay finished: {report}")
+        return report
@@ -0,0 +1,61 @@
+"""Local stand-in for requests.Session that serves responses from a traffic trace."""
+import json
+import threading
+
+import requests
+
+from ..utils.clock import Clock, get_clock
+from .trace import CONNECTION_ERROR, TIMEOUT, TrafficTrace
+
+
+def _read_timeout(timeout):
+    # requests accepts a single timeout or a (connect, read) tuple
+    return timeout[-1] if isinstance(timeout, tuple) else timeout
+
+
+class FaultInjectingSession(requests.Session):
+    """
+    Answers every request from the next trace event instead of the network.
+    Latency is charged to the clock (virtual in replays); the last event repeats once the trace is exhausted.
+    Events slower than the request's timeout raise requests.ReadTimeout, as a real request would.
+    """
+
+    def __init__(self, trace: TrafficTrace, clock: Clock = None):
+        super().__init__()
+        self.trace = trace
+        self.clock = clock
+        self.cursor = 0
+        self.requests_served = 0
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Rewind to the start of the trace, e.g. between scenarios."""
+        with self._lock:
+            self.cursor = 0
+
+    def request(self, method, url, *args, **kwargs):
+        with self._lock:
+            event = self.trace.events[min(self.cursor, len(self.trace.events) - 1)]
+            self.cursor += 1
+            self.requests_served += 1
+
+        clock = self.clock or get_clock()
+        timeout = _read_timeout(kwargs.get('timeout'))
+        if event.error == CONNECTION_ERROR:
+            clock.sleep(event.latency)
+            raise requests.ConnectionError(f"Failed to establish a new connection to {url}: Connection refused")
+        if event.error == TIMEOUT or (timeout is not None and event.latency > timeout):
+            clock.sleep(event.latency if timeout is None else min(event.latency, timeout))
+            raise requests.ReadTimeout(f"{url}: Read timed out. (read timeout={timeout})")
+        clock.sleep(event.latency)
+
+        response = requests.Response()
+        response.status_code = event.status
+        response.url = url
+        response.reason = requests.status_codes._codes.get(event.status, ("",))[0].replace("_", " ").title()
+        if event.retry_after is not None:
+            response.headers["Retry-After"] = str(event.retry_after)
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(event.body).encode() if event.body is not None else b""
+        response.request = requests.Request(method, url).prepare()
+        return response
@@ -0,0 +1,104 @@
+"""Recorded HTTP traffic traces for fault-injection replays."""
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+
+
+# Event errors: the request timed out, or no connection could be made
+TIMEOUT = "timeout"
+CONNECTION_ERROR = "connection"
+
+
+class TraceEvent:
+    """
+    One recorded response: latency, status code, optional Retry-After and JSON body.
+    Events with an `error` (TIMEOUT or CONNECTION_ERROR) describe requests that never got a response.
+    """
+
+    def __init__(self, status: int = 200, latency: float = 0.0, retry_after: Optional[float] = None, body: Any = None,
+                 error: Optional[str] = None):
+        if error not in (None, TIMEOUT, CONNECTION_ERROR):
+            raise ValueError(f"Unknown trace event error: {error}")
+        self.status = int(status)
+        self.latency = float(latency)
+        self.retry_after = retry_after
+        self.body = body
+        self.error = error
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TraceEvent":
+        return cls(
+            status=data.get("status", 200),
+            latency=data.get("latency", 0.0),
+            retry_after=data.get("retry_after"),
+            body=data.get("body"),
+            error=data.get("error")
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = {"status": self.status, "latency": self.latency, "retry_after": self.retry_after, "body": self.body}
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class TrafficTrace:
+    """Ordered list of trace events, stored as JSON Lines."""
+
+    def __init__(self, events: Iterable[TraceEvent]):
+        self.events: List[TraceEvent] = list(events)
+        if not self.events:
+            raise ValueError("A traffic trace needs at least one event.")
+
+    @classmethod
+    def load(cls, path: str) -> "TrafficTrace":
+        with open(path, encoding="utf-8") as f:
+            return cls(TraceEvent.from_dict(json.loads(line)) for line in f if line.strip())
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            for event in self.events:
+                f.write(json.dumps(event.as_dict()) + "\n")
+
+    @classmethod
+    def rate_limit_demo(cls) -> "TrafficTrace":
+        """The classic demo: one 429 followed by a successful response."""
+        return cls([
+            TraceEvent(status=429, latency=0.05, retry_after=2, body={"error": "Too Many Requests"}),
+            TraceEvent(status=200, latency=0.08, body={"userId": 1, "id": 1, "title": "delectus aut autem", "completed": False})
+        ])
+
+
+class RecordingSession(requests.Session):
+    """Session that records every response it sees, so live traffic can be replayed later."""
+
+    def __init__(self):
+        super().__init__()
+        self.events: List[TraceEvent] = []
+
+    def request(self, method, url, *args, **kwargs):
+        started = time.monotonic()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            # ConnectTimeout is both; either way no response came back
+            error = TIMEOUT if isinstance(e, requests.Timeout) else CONNECTION_ERROR
+            self.events.append(TraceEvent(status=0, latency=time.monotonic() - started, error=error))
+            raise
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        retry_after = response.headers.get("Retry-After")
+        self.events.append(TraceEvent(
+            status=response.status_code,
+            latency=time.monotonic() - started,
+            retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+            body=body
+        ))
+        return response
+
+    def trace(self) -> TrafficTrace:
+        return TrafficTrace(self.events)
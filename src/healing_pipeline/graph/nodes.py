@@ -1,34 +1,132 @@
 """Graph node functions for the healing pipeline."""
 from ..config import settings
 from ..core.agent import AutomatedWatchdog
-from ..core.strategies import StrategyFactory
-from ..core.worker import TaxDataIngestor
+from ..core.budget import bounded_timeout, fits_budget, remaining_budget
+from ..core.health import get_health_checker
+from ..core.report import report_backoff, report_counter
+from ..core.policy import RecoveryPolicy, error_signature, get_policy, is_transient, share_classification
+from ..core.strategies import RetryStrategy, StrategyFactory
+from ..core.worker import REQUEST_TIMEOUT_SECONDS, TaxDataIngestor
 from ..graph.state import AgentState
+from ..utils.clock import get_clock
 from ..utils.logging import logger, log_healed_incident, log_hard_failure
+from ..utils.tax_cache import get_tax_cache, order_fingerprint
 from ..utils.tax_calculator import TaxCalculator
 
+def _record_incident(incident: dict, success: bool):
+    """Close out a pending recovery attempt in the incident store."""
+    policy = get_policy()
+    if not incident or policy is None:
+        return
+    elapsed = get_clock().time() - incident['started_at']
+    policy.store.record(incident['signature'], incident['action'], incident['wait_seconds'], success, elapsed)
+    if incident['action'] == "RETRY":
+        share_classification(policy.store, incident['signature'])
+
+
+def _signature(state: AgentState) -> str:
+    """Error signature of the last failure, keyed on the HTTP status when the response carried one."""
+    return error_signature(state.get('error'), state.get('error_status'))
+
+
+def _append_error(state: AgentState, node: str, error: str) -> list:
+    """Return the order's error history with a new failure appended."""
+    entry = {"node": node, "error": error, "retry_count": state.get('retry_count', 0), "url": state.get('url'), "at": get_clock().time()}
+    return list(state.get('error_history') or []) + [entry]
+
+
 # Ideally, we inject dependencies, but simple instantiation for now
 def ingest_node(state: AgentState) -> AgentState:
     """Ingest data from external API and handle transient failures."""
-    ingestor = TaxDataIngestor(state['url'])
+    url = state['url']
+    update = {}
+
+    # Skip an endpoint the health checker already knows is down
+    checker = get_health_checker(start=False)
+    if checker is not None and checker.is_healthy(url) is False:
+        best = checker.best_endpoint(exclude=url)
+        if best:
+            logger.warning(f"Endpoint {url} unhealthy, routing ingestion to {best}")
+            url = update["url"] = best
+            report_counter("failovers")
 
-    # Control simulation of failures based on retry count
-    # (first attempt triggers simulated 429, subsequent attempts succeed)
-    should_simulate_fail = (state['retry_count'] == 0)
-    ingestor._simulate_failure = should_simulate_fail
-    ingestor.request_count = 0 if should_simulate_fail else 1
+    ingestor = TaxDataIngestor(url)
 
     try:
-        result = ingestor.execute_ingestion()
+        # The attempt may not outlast the order or batch deadline
+        result = ingestor.execute_ingestion(timeout=bounded_timeout(REQUEST_TIMEOUT_SECONDS, state))
         logger.info(f"Ingestion successful on attempt {state['retry_count'] + 1}")
+        _record_incident(state.get('incident'), True)
         return {
+            **update,
             "status": "success",
             "error": None,
-            "ingested_data": result.get('data') if isinstance(result, dict) else result
+            "error_status": None,
+            "ingested_data": result.get('data') if isinstance(result, dict) else result,
+            "incident": None,
+            "retry_after": None
         }
     except Exception as e:
         logger.error(f"Ingestion failed: {e}")
-        return {"status": "failed", "error": str(e)}
+        retry_after = None
+        response = getattr(e, 'response', None)
+        status_code = getattr(response, 'status_code', None)
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get('Retry-After'))
+            except (TypeError, ValueError):
+                retry_after = None
+        _record_incident(state.get('incident'), False)
+        return {
+            **update,
+            "status": "failed",
+            "error": str(e),
+            "error_status": status_code,
+            "incident": None,
+            "retry_after": retry_after,
+            "error_history": _append_error(state, "ingest", str(e))
+        }
+
+
+def fast_path_wait(state: AgentState) -> float:
+    """Inline backoff for a transient failure: honour Retry-After, else exponential backoff."""
+    if state.get('retry_after'):
+        return min(float(state['retry_after']), RetryStrategy.MAX_WAIT_SECONDS)
+    return RetryStrategy.backoff_seconds({
+        "wait_seconds": settings.FAST_PATH_BASE_WAIT_SECONDS,
+        "retry_count": state['retry_count']
+    })
+
+
+def use_fast_path(state: AgentState) -> bool:
+    """Known-transient errors whose backoff fits the deadline skip analyze/heal."""
+    if not is_transient(_signature(state)):
+        return False
+    return fits_budget(fast_path_wait(state), remaining_budget(state))
+
+
+def backoff_node(state: AgentState) -> AgentState:
+    """Fast path for transient errors: back off inline and loop straight back to ingestion."""
+    wait_seconds = fast_path_wait(state)
+    signature = _signature(state)
+    logger.info(f"Fast path: transient {signature}, backing off {wait_seconds}s (retry {state['retry_count']})")
+    started_at = get_clock().time()
+    get_clock().sleep(wait_seconds)
+    report_counter("fast_path_retries")
+    report_backoff(wait_seconds)
+    # Outcomes still feed the incident store like any other RETRY, under the base wait actually used
+    # (a Retry-After header may have replaced the exponential backoff)
+    action, base_wait = RecoveryPolicy.arm_for("RETRY", wait_seconds / (2 ** min(state['retry_count'], 16)))
+    return {
+        "status": "healing_complete",
+        "retry_count": state['retry_count'] + 1,
+        "incident": {
+            "signature": signature,
+            "action": action,
+            "wait_seconds": base_wait,
+            "started_at": started_at
+        }
+    }
 
 
 def enrich_node(state: AgentState) -> AgentState:
@@ -36,9 +134,9 @@ def enrich_node(state: AgentState) -> AgentState:
     Enriches ingested data by calculating tax via TaxJar and validating the result.
     On validation failure, the state will be marked as failed so the analyze/heal loop runs.
     """
-    # Try to obtain an order payload from ingestion; fall back to a demo order for testing
-    order = state.get('ingested_data')
-    if not order or not isinstance(order, dict):
+    # Prefer the order supplied to the engine, then the ingestion payload; fall back to a demo order for testing
+    order = state.get('order') or state.get('ingested_data')
+    if not order or not isinstance(order, dict) or 'amount' not in order:
         # Demo order (same shape as tests/test_taxjar.py)
         order = {
           'from_country': 'US',
@@ -74,10 +172,23 @@ def enrich_node(state: AgentState) -> AgentState:
           ]
         }
 
+    # Unchanged orders reuse the validated result from a previous run
+    cache = get_tax_cache()
+    fingerprint = order_fingerprint(order) if cache is not None else None
+    if cache is not None:
+        cached = cache.get(fingerprint)
+        if cached is not None:
+            logger.info(f"✓ Tax result cache hit ({fingerprint[:12]}), skipping TaxJar")
+            report_counter("taxjar_calls_avoided")
+            return {"status": "success", "tax_result": cached, "healing_result": True}
+
     calculator = None
+    from_taxjar = False
     try:
         calculator = TaxCalculator()
+        report_counter("taxjar_calls")
         tax_result = calculator.calculate_tax_for_order(order)
+        from_taxjar = True
         logger.info("✓ TaxJar API call successful")
     except Exception as e:
         logger.warning(f"TaxJar API failed ({type(e).__name__}), using mock result")
@@ -100,10 +211,10 @@ def enrich_node(state: AgentState) -> AgentState:
     amount_to_collect = _get(tax_result, 'amount_to_collect')
     order_total_amount = _get(tax_result, 'order_total_amount')
 
-    # Basic validation: order total should match amount + shipping + collected tax
+    # Basic validation: TaxJar's order total is amount + shipping (collected tax is reported separately)
     expected_total = None
     try:
-        expected_total = float(order.get('amount', 0)) + float(order.get('shipping', 0)) + float(amount_to_collect or 0)
+        expected_total = float(order.get('amount', 0)) + float(order.get('shipping', 0))
     except Exception:
         expected_total = None
 
@@ -117,17 +228,48 @@ def enrich_node(state: AgentState) -> AgentState:
     if valid:
         # Log successful validation and attach tax result
         log_healed_incident("TaxCalculator", "VALIDATION", f"Tax validated. Collected: ${amount_to_collect}, Total: ${order_total_amount}")
+        # Only real, validated TaxJar answers are worth remembering
+        if cache is not None and from_taxjar:
+            try:
+                cache.put(fingerprint, tax_result)
+            except Exception as e:
+                logger.warning(f"Failed to cache tax result: {e}")
         return {"status": "success", "tax_result": tax_result, "healing_result": True}
     else:
         logger.error(f"Tax validation failed. expected=${expected_total} got=${order_total_amount}")
         # Attach tax_result for debugging and trigger analysis/heal
-        return {"status": "failed", "error": "Tax validation failed", "tax_result": tax_result}
+        return {
+            "status": "failed",
+            "error": "Tax validation failed",
+            "error_status": None,
+            "tax_result": tax_result,
+            "error_history": _append_error(state, "enrich", "Tax validation failed")
+        }
 
 
 def analyze_node(state: AgentState) -> AgentState:
-    """Analyze error and generate recovery plan using AI Watchdog."""
-    watchdog = AutomatedWatchdog()
-    context = {"url": state['url'], "retry_count": state['retry_count']}
+    """Analyze error and generate recovery plan, preferring the learned policy over the AI Watchdog."""
+    remaining = remaining_budget(state)
+    policy = get_policy()
+    if policy is not None:
+        max_wait = None
+        if remaining is not None:
+            # Arms carry the base wait; scale the budget back by the backoff multiplier
+            max_wait = (remaining - settings.ATTEMPT_COST_SECONDS) / (2 ** min(state['retry_count'], 16))
+        plan = policy.select(
+            _signature(state),
+            allow_failover=bool(settings.TAX_API_FAILOVER_URL),
+            max_wait=max_wait
+        )
+        if plan:
+            logger.info(f"Recovery plan from learned policy: {plan['recovery_action']} (wait {plan['wait_seconds']}s)")
+            report_counter("policy_plans")
+            return {"plan": plan, "status": "healing"}
+
+    watchdog = AutomatedWatchdog(timeout=bounded_timeout(None, state))
+    context = {"url": state['url'], "retry_count": state['retry_count'], "status_code": state.get('error_status')}
+    if remaining is not None:
+        context["remaining_budget_seconds"] = round(max(remaining, 0), 1)
 
     try:
         plan = watchdog.analyze_error(Exception(state['error']), context)
@@ -150,24 +292,70 @@ def heal_node(state: AgentState) -> AgentState:
         return {"healing_result": False, "status": "failed"}
 
     try:
-        strategy = StrategyFactory.get_strategy(action)
         strategy_context = {
             "wait_seconds": plan.get('wait_seconds', 1),
             "rationale": plan.get('rationale'),
             "failover_url": getattr(settings, 'TAX_API_FAILOVER_URL', "http://failover-api"),
-            "retry_count": state.get('retry_count', 0)
+            "retry_count": state.get('retry_count', 0),
+            "current_url": state['url']
+        }
+
+        # Skip retries whose backoff cannot finish inside the remaining deadline budget
+        actions = StrategyFactory.parse_actions(action)
+        remaining = remaining_budget(state)
+        if "RETRY" in actions and not fits_budget(RetryStrategy.backoff_seconds(strategy_context), remaining):
+            actions.remove("RETRY")
+            if not any(a != "ESCALATE" for a in actions):
+                # Failover if there is somewhere to go; escalate if that fails too
+                failover_url = strategy_context['failover_url']
+                if failover_url and failover_url != state['url']:
+                    actions.insert(0, "FAILOVER")
+                if "ESCALATE" not in actions:
+                    actions.append("ESCALATE")
+            strategy_context['rationale'] = f"Retry backoff exceeds remaining budget ({remaining:.1f}s)"
+            logger.warning(f"Deadline budget too small for RETRY, switching to {' | '.join(actions)}")
+
+        strategy = StrategyFactory.get_strategy(" | ".join(actions))
+
+        incident = {
+            "signature": _signature(state),
+            "action": actions[0],
+            "wait_seconds": float(strategy_context['wait_seconds'] or 0),
+            "started_at": get_clock().time()
         }
 
         result = strategy.execute(strategy_context)
+        # Composite strategies report which of their actions actually committed
+        incident["action"], incident["wait_seconds"] = RecoveryPolicy.arm_for(
+            getattr(strategy, 'winner', None) or incident["action"], incident["wait_seconds"]
+        )
+        if isinstance(result, dict) and result.get("action") == "escalate":
+            _record_incident(incident, False)
+            return {
+                "healing_result": False,
+                "status": "escalated",
+                "incident": None,
+                "error_history": _append_error(state, "heal", f"Escalated: {result['reason']}")
+            }
+        if result is False:
+            _record_incident(incident, False)
+            return {
+                "healing_result": False,
+                "status": "failed",
+                "incident": None,
+                "error_history": _append_error(state, "heal", f"Recovery action {' | '.join(actions)} failed")
+            }
         state_update = {
             "healing_result": result,
             "status": "healing_complete",
-            "retry_count": state['retry_count'] + 1
+            "retry_count": state['retry_count'] + 1,
+            "incident": incident
         }
 
         # Apply URL update if returned by failover strategy
         if isinstance(result, dict) and result.get("action") == "update_url":
             state_update["url"] = result["url"]
+            report_counter("failovers")
 
         return state_update
 
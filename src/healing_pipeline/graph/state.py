@@ -1,4 +1,4 @@
-from typing import TypedDict, Optional, Dict, Any, Union
+from typing import TypedDict, Optional, Dict, Any, List, Union
 
 class AgentState(TypedDict):
     """Represents the complete state of the healing agent workflow."""
@@ -6,8 +6,15 @@ class AgentState(TypedDict):
     max_retries: int
     url: str
     error: Optional[str]
+    error_status: Optional[int]  # HTTP status of the failed response, if the error carried one
     plan: Optional[Dict[str, Any]]
     healing_result: Optional[Union[bool, Dict[str, Any]]]
-    status: str  # 'running', 'success', 'failed', 'healing', 'healing_complete'
+    status: str  # 'running', 'success', 'failed', 'healing', 'healing_complete', 'escalated'
     ingested_data: Optional[Any]  # Data from successful ingestion
     tax_result: Optional[Dict[str, Any]]  # Tax calculation result
+    incident: Optional[Dict[str, Any]]  # Pending recovery attempt awaiting its outcome
+    order: Optional[Dict[str, Any]]  # Order payload to enrich; falls back to ingested data
+    order_deadline: Optional[float]  # Absolute epoch deadline for this order
+    batch_deadline: Optional[float]  # Absolute epoch deadline for the enclosing batch
+    retry_after: Optional[float]  # Retry-After seconds from the last failed response, if any
+    error_history: List[Dict[str, Any]]  # Every failure seen for this order, oldest first
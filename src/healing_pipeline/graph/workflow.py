@@ -1,17 +1,37 @@
 from langgraph.graph import StateGraph, END
 from .state import AgentState
-from .nodes import ingest_node, analyze_node, heal_node, enrich_node
+from .nodes import ingest_node, analyze_node, heal_node, enrich_node, backoff_node, use_fast_path
+from ..config import settings
+from ..core.budget import remaining_budget
+from ..core.report import timed_node
 from ..utils.logging import logger
 
+def budget_exhausted(state: AgentState) -> bool:
+    """Whether the order has used up its retries or its deadline budget."""
+    if state['retry_count'] >= state['max_retries']:
+        return True
+    remaining = remaining_budget(state)
+    if remaining is not None and remaining <= 0:
+        logger.error(f"Deadline budget exhausted after {state['retry_count']} retries")
+        return True
+    return False
+
 def should_heal(state: AgentState):
     """Conditional edge: success -> end, fail -> analyze."""
     # If ingestion succeeded we proceed to enrichment (tax calc)
     if state['status'] == 'success':
         return "enrich"
-    if state['retry_count'] >= state['max_retries']:
+    if budget_exhausted(state):
         return "end"
     return "analyze"
 
+def should_fast_heal(state: AgentState):
+    """Conditional edge with fast path: known-transient failures -> backoff -> ingest."""
+    route = should_heal(state)
+    if route == "analyze" and use_fast_path(state):
+        return "backoff"
+    return route
+
 def should_retry(state: AgentState):
     """Conditional edge: after healing -> ingest (with update) or end (if failed)."""
     healing_result = state['healing_result']
@@ -37,34 +57,43 @@ def should_retry(state: AgentState):
     
     return "ingest"
 
-def create_healing_graph():
+def create_healing_graph(fast_path: bool = None):
+    """Build and compile the graph; `fast_path` defaults to settings.FAST_PATH_ENABLED."""
+    if fast_path is None:
+        fast_path = settings.FAST_PATH_ENABLED
     workflow = StateGraph(AgentState)
     
-    # Add Nodes
-    workflow.add_node("ingest", ingest_node)
-    workflow.add_node("enrich", enrich_node)
-    workflow.add_node("analyze", analyze_node)
-    workflow.add_node("heal", heal_node)
+    # Add Nodes (timed for the run report)
+    workflow.add_node("ingest", timed_node("ingest", ingest_node))
+    workflow.add_node("enrich", timed_node("enrich", enrich_node))
+    workflow.add_node("analyze", timed_node("analyze", analyze_node))
+    workflow.add_node("heal", timed_node("heal", heal_node))
+    if fast_path:
+        workflow.add_node("backoff", timed_node("backoff", backoff_node))
     
     # Set Entry Point
     workflow.set_entry_point("ingest")
     
     # Add Edges
+    ingest_routes = {
+        "end": END,
+        "analyze": "analyze",
+        "enrich": "enrich"
+    }
+    if fast_path:
+        ingest_routes["backoff"] = "backoff"
+        workflow.add_edge("backoff", "ingest")
     workflow.add_conditional_edges(
         "ingest",
-        should_heal,
-        {
-            "end": END,
-            "analyze": "analyze",
-            "enrich": "enrich"
-        }
+        should_fast_heal if fast_path else should_heal,
+        ingest_routes
     )
     
     workflow.add_edge("analyze", "heal")
 
     # After enrichment, either finish (success) or analyze on validation failure
     def should_validate(state: AgentState):
-        if state.get('status') == 'success':
+        if state.get('status') == 'success' or budget_exhausted(state):
             return 'end'
         return 'analyze'
 
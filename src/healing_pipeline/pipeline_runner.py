@@ -101,12 +101,25 @@ class PipelineRunner:
             print(f"📝 Error: {self.results['error']}")
         elif self.results.get('success'):
             print("✅ Status: SUCCESS")
-            print("✓ Data ingestion completed")
-            print("✓ Tax calculation validated")
-            print("✓ Compliance logging successful")
+        elif self.engine.last_report is not None:
+            print("❌ Status: FAILED")
         else:
             print("⚠️  Status: UNKNOWN")
 
+        report = self.engine.last_report.to_dict() if self.engine.last_report else None
+        if report:
+            counters = report['counters']
+            print(f"📦 Orders: {report['orders_succeeded']}/{report['orders_processed']} succeeded "
+                  f"({report['orders_per_second']} orders/s, {report['wall_seconds']}s)")
+            print(f"🔁 Retries: {report['retries']['total']} | Failovers: {report['failovers']['total']} | "
+                  f"Backoff: {report['backoff_seconds']}s")
+            print(f"🤖 Plans: {counters['llm_calls']} LLM, {counters['mock_plans']} mock, "
+                  f"{counters['policy_plans']} policy, {counters['fast_path_retries']} fast-path")
+            print(f"💰 TaxJar: {counters['taxjar_calls']} calls, {counters['taxjar_calls_avoided']} avoided via cache")
+            for node, stats in report['node_latency'].items():
+                print(f"⏱️  {node:<8} x{stats['count']:<3} p50 {stats['p50_ms']}ms | p95 {stats['p95_ms']}ms")
+            self.results['report'] = report
+
         print(f"⏰ Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 80 + "\n")
 
@@ -0,0 +1,62 @@
+"""Swappable time source so backoff waits and deadlines can run on a virtual clock."""
+import threading
+import time
+
+class Clock:
+    """Wall-clock time; the default for production runs."""
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        """Wait up to `seconds` for `event`; True if it was set."""
+        return event.wait(seconds)
+
+class VirtualClock(Clock):
+    """Clock that advances instantly on sleep, for deterministic fault-injection replays."""
+
+    def __init__(self, start: float = 0.0, wait_grace: float = 0.05):
+        self._now = start
+        self.wait_grace = wait_grace
+        self._lock = threading.Lock()
+        self.slept = 0.0
+
+    def time(self) -> float:
+        with self._lock:
+            return self._now
+
+    def monotonic(self) -> float:
+        return self.time()
+
+    def advance(self, seconds: float):
+        with self._lock:
+            self._now += max(seconds, 0.0)
+
+    def sleep(self, seconds: float):
+        self.advance(seconds)
+        with self._lock:
+            self.slept += max(seconds, 0.0)
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        # Concurrent work that doesn't wait (e.g. a composite's failover) would finish long before a
+        # real backoff elapsed, so give it a moment of real time before virtual time jumps ahead
+        if event.wait(self.wait_grace):
+            return True
+        self.sleep(seconds)
+        return event.is_set()
+
+_clock: Clock = Clock()
+
+def get_clock() -> Clock:
+    return _clock
+
+def set_clock(clock: Clock = None):
+    """Install a clock process-wide; None restores wall-clock time."""
+    global _clock
+    _clock = clock or Clock()
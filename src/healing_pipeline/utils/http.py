@@ -0,0 +1,26 @@
+"""Process-wide HTTP session so probes and ingestion share warm connection pools."""
+from typing import Optional
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """Return the shared session, creating it on first use."""
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+def set_session(session: Optional[requests.Session]):
+    """Replace the shared session (None resets to a fresh default on next use)."""
+    global _session
+    with _lock:
+        _session = session
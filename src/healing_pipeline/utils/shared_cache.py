@@ -0,0 +1,191 @@
+"""
+Cross-process cache on a memory-mapped file (in /dev/shm where available).
+
+The file is a fixed array of slots addressed by key hash with linear probing.
+Each slot is guarded by a sequence counter (seqlock): writers serialize on an
+flock and bump the counter to odd while writing and back to even when done;
+readers never lock, they retry if the counter was odd or changed mid-read.
+
+Files are never resized once in use (other processes may have them mapped),
+so each layout (format version, slot count, slot size) gets its own file.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: falls back to in-process locking only
+    fcntl = None
+
+from healing_pipeline.config import settings
+from healing_pipeline.utils.logging import logger
+
+_MAGIC = b"HPSC"
+_FILE_HEADER = struct.Struct("<4sIII")      # magic, format version, slot count, slot size
+_SLOT_HEADER = struct.Struct("<IQdI")       # seq, key hash, stored_at, payload length
+_FORMAT_VERSION = 1
+_MAX_PROBES = 8
+_READ_RETRIES = 16
+
+
+def _key_hash(key: str) -> int:
+    # 0 marks an empty slot, so never hand it out
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little") or 1
+
+
+class SharedCache:
+    """
+    Fixed-size key/value cache shared by every process that maps the same file.
+    Raises OSError if the file already holds a different layout.
+    """
+
+    def __init__(self, path: str, slots: int = None, slot_size: int = 1024, ttl_seconds: float = None):
+        self.path = path
+        self.slots = slots or settings.SHARED_CACHE_SLOTS
+        self.slot_size = slot_size
+        self.ttl_seconds = ttl_seconds
+        self._thread_lock = threading.Lock()
+        size = _FILE_HEADER.size + self.slots * self.slot_size
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._write_lock():
+            expected = _FILE_HEADER.pack(_MAGIC, _FORMAT_VERSION, self.slots, self.slot_size)
+            if os.fstat(self._fd).st_size == 0:
+                os.ftruncate(self._fd, size)
+                os.pwrite(self._fd, expected, 0)
+            elif os.pread(self._fd, _FILE_HEADER.size, 0) != expected or os.fstat(self._fd).st_size < size:
+                # Truncating would crash every process that has the file mapped (SIGBUS)
+                os.close(self._fd)
+                raise OSError(f"{path} holds an incompatible cache layout")
+        self._map = mmap.mmap(self._fd, size)
+
+    @contextmanager
+    def _write_lock(self):
+        """Serialize writers across threads and processes; readers never take it."""
+        with self._thread_lock:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _offset(self, index: int) -> int:
+        return _FILE_HEADER.size + index * self.slot_size
+
+    def _probe(self, key_hash: int):
+        start = key_hash % self.slots
+        for i in range(min(_MAX_PROBES, self.slots)):
+            yield (start + i) % self.slots
+
+    def _read_slot(self, index: int):
+        """Consistent (key hash, stored_at, payload) snapshot of a slot, or None if it kept changing."""
+        offset = self._offset(index)
+        for _ in range(_READ_RETRIES):
+            seq, key_hash, stored_at, length = _SLOT_HEADER.unpack_from(self._map, offset)
+            if seq & 1:
+                continue
+            payload = bytes(self._map[offset + _SLOT_HEADER.size:offset + _SLOT_HEADER.size + length])
+            if _SLOT_HEADER.unpack_from(self._map, offset)[0] == seq:
+                return key_hash, stored_at, payload
+        return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Lock-free lookup; None on miss, expiry or a torn read."""
+        key_hash = _key_hash(key)
+        for index in self._probe(key_hash):
+            snapshot = self._read_slot(index)
+            if snapshot is None or snapshot[0] == 0:
+                continue
+            slot_hash, stored_at, payload = snapshot
+            if slot_hash != key_hash:
+                continue
+            if self.ttl_seconds is not None and time.time() - stored_at > self.ttl_seconds:
+                return None
+            try:
+                entry = json.loads(payload)
+            except ValueError:
+                return None
+            # Guard against 64-bit hash collisions
+            if entry.get("k") == key:
+                return entry.get("v")
+        return None
+
+    def put(self, key: str, value: Any) -> bool:
+        """Store a JSON-serializable value; False if it does not fit in a slot."""
+        payload = json.dumps({"k": key, "v": value}, default=str, separators=(",", ":")).encode("utf-8")
+        if _SLOT_HEADER.size + len(payload) > self.slot_size:
+            return False
+        key_hash = _key_hash(key)
+
+        with self._write_lock():
+            target, oldest = None, None
+            for index in self._probe(key_hash):
+                _, slot_hash, stored_at, _ = _SLOT_HEADER.unpack_from(self._map, self._offset(index))
+                if slot_hash in (0, key_hash):
+                    target = index
+                    break
+                if oldest is None or stored_at < oldest[1]:
+                    oldest = (index, stored_at)
+            if target is None:
+                target = oldest[0]  # Probe window full: evict the oldest entry
+
+            offset = self._offset(target)
+            seq = _SLOT_HEADER.unpack_from(self._map, offset)[0]
+            writing, done = (seq + 1) & 0xFFFFFFFF, (seq + 2) & 0xFFFFFFFF
+            struct.pack_into("<I", self._map, offset, writing)
+            self._map[offset + _SLOT_HEADER.size:offset + _SLOT_HEADER.size + len(payload)] = payload
+            _SLOT_HEADER.pack_into(self._map, offset, writing, key_hash, time.time(), len(payload))
+            struct.pack_into("<I", self._map, offset, done)
+        return True
+
+    def close(self):
+        self._map.close()
+        os.close(self._fd)
+
+
+# Slot sizes per namespace; tax results carry jurisdiction breakdowns and need more room
+NAMESPACE_SLOT_SIZES = {"plans": 1024, "classifications": 512, "tax_results": 8192}
+
+_caches: Dict[str, Optional[SharedCache]] = {}
+_caches_lock = threading.Lock()
+
+
+def shared_cache_dir() -> str:
+    if settings.SHARED_CACHE_DIR:
+        return settings.SHARED_CACHE_DIR
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+def shared_cache_path(namespace: str, slots: int, slot_size: int) -> str:
+    """Workers configured with different layouts map different files instead of clobbering each other."""
+    return os.path.join(
+        shared_cache_dir(), f"healing_pipeline-{namespace}-v{_FORMAT_VERSION}-{slots}x{slot_size}.cache"
+    )
+
+
+def get_shared_cache(namespace: str, ttl_seconds: float = None) -> Optional[SharedCache]:
+    """Process-wide handle on a host-wide cache namespace; None when disabled or unavailable."""
+    if not settings.SHARED_CACHE_ENABLED:
+        return None
+    with _caches_lock:
+        if namespace not in _caches:
+            slot_size = NAMESPACE_SLOT_SIZES.get(namespace, 1024)
+            path = shared_cache_path(namespace, settings.SHARED_CACHE_SLOTS, slot_size)
+            try:
+                _caches[namespace] = SharedCache(
+                    path, slots=settings.SHARED_CACHE_SLOTS, slot_size=slot_size, ttl_seconds=ttl_seconds
+                )
+            except OSError as e:
+                logger.warning(f"Shared cache '{namespace}' unavailable ({e}). Sharing disabled.")
+                _caches[namespace] = None
+        return _caches[namespace]
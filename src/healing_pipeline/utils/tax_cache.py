@@ -0,0 +1,166 @@
+"""Persistent, content-addressed cache of TaxJar results keyed by a canonical order fingerprint."""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from healing_pipeline.config import settings
+from healing_pipeline.utils.logging import logger
+from healing_pipeline.utils.shared_cache import SharedCache, get_shared_cache
+
+# Bump when the fingerprint or stored payload format changes
+CACHE_FORMAT_VERSION = 1
+
+# Order fields TaxJar's tax_for_order uses; anything else cannot change the result
+TAXJAR_ORDER_FIELDS = (
+    'from_country', 'from_zip', 'from_state', 'from_city', 'from_street',
+    'to_country', 'to_zip', 'to_state', 'to_city', 'to_street',
+    'amount', 'shipping', 'customer_id', 'exemption_type',
+    'nexus_addresses', 'line_items'
+)
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return round(float(value), 4)
+    if isinstance(value, str):
+        return " ".join(value.split()).upper()
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items() if v is not None}
+    if isinstance(value, (list, tuple)):
+        # Line items and nexus addresses are unordered sets as far as tax is concerned
+        items = [_normalize(v) for v in value]
+        return sorted(items, key=lambda v: json.dumps(v, sort_keys=True))
+    return str(value)
+
+
+def order_fingerprint(order: Dict[str, Any]) -> str:
+    """SHA-256 of the normalized TaxJar-relevant order fields."""
+    relevant = {k: _normalize(order[k]) for k in TAXJAR_ORDER_FIELDS if order.get(k) is not None}
+    canonical = json.dumps(relevant, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def tax_result_to_dict(result: Any) -> Dict[str, Any]:
+    """TaxJar returns jsonobject models; store them as plain dicts."""
+    if isinstance(result, dict):
+        return result
+    if hasattr(result, "to_json"):
+        return result.to_json()
+    return dict(vars(result))
+
+
+class TaxResultCache:
+    """
+    SQLite-backed result store.
+    Entries are invalidated when the cache version or rate-effective date changes,
+    and the least recently used entries are evicted beyond `max_entries`.
+    An optional host-wide SharedCache sits in front so workers see each other's results immediately.
+    """
+
+    def __init__(self, path: str = None, max_entries: int = None, version: str = None, rate_effective_date: str = None,
+                 shared: SharedCache = None):
+        self.path = path or settings.TAX_CACHE_DB_PATH
+        self.max_entries = max_entries if max_entries is not None else settings.TAX_CACHE_MAX_ENTRIES
+        self.version = f"{CACHE_FORMAT_VERSION}:{version if version is not None else settings.TAX_CACHE_VERSION}"
+        self.rate_effective_date = rate_effective_date if rate_effective_date is not None else settings.TAX_RATE_EFFECTIVE_DATE
+        self.shared = shared
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS tax_results (
+                fingerprint TEXT PRIMARY KEY,
+                result_json TEXT NOT NULL,
+                version TEXT NOT NULL,
+                rate_effective_date TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tax_results_accessed ON tax_results(last_accessed)")
+        self._conn.commit()
+
+    def _shared_key(self, fingerprint: str) -> str:
+        # Version and rate date are part of the key, so stale shared entries simply never match
+        return f"{self.version}|{self.rate_effective_date}|{fingerprint}"
+
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        if self.shared is not None:
+            result = self.shared.get(self._shared_key(fingerprint))
+            if result is not None:
+                return result
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result_json, version, rate_effective_date FROM tax_results WHERE fingerprint = ?",
+                (fingerprint,)
+            ).fetchone()
+            if row is None:
+                return None
+            result_json, version, rate_date = row
+            if version != self.version or rate_date != self.rate_effective_date:
+                self._conn.execute("DELETE FROM tax_results WHERE fingerprint = ?", (fingerprint,))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE tax_results SET last_accessed = ? WHERE fingerprint = ?", (time.time(), fingerprint)
+            )
+            self._conn.commit()
+        result = json.loads(result_json)
+        if self.shared is not None:
+            self.shared.put(self._shared_key(fingerprint), result)
+        return result
+
+    def put(self, fingerprint: str, result: Any):
+        now = time.time()
+        result = tax_result_to_dict(result)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tax_results "
+                "(fingerprint, result_json, version, rate_effective_date, created_at, last_accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (fingerprint, json.dumps(result, default=str), self.version,
+                 self.rate_effective_date, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+        if self.shared is not None:
+            self.shared.put(self._shared_key(fingerprint), result)
+
+    def _evict(self):
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM tax_results").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM tax_results WHERE fingerprint IN "
+                "(SELECT fingerprint FROM tax_results ORDER BY last_accessed LIMIT ?)",
+                (overflow,)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tax_results").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[TaxResultCache] = None
+
+
+def get_tax_cache() -> Optional[TaxResultCache]:
+    """Process-wide cache; None when disabled or the store cannot be opened."""
+    global _cache
+    if not settings.TAX_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        try:
+            _cache = TaxResultCache(shared=get_shared_cache("tax_results"))
+        except sqlite3.Error as e:
+            logger.warning(f"Tax result cache unavailable ({e}). Caching disabled.")
+            return None
+    return _cache
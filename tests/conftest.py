@@ -0,0 +1,46 @@
+"""Shared fixtures: run graph nodes and engines offline against a traffic trace on a virtual clock."""
+import random
+
+import pytest
+
+from healing_pipeline.config import settings
+from healing_pipeline.core.policy import IncidentStore, RecoveryPolicy, get_policy, set_policy
+from healing_pipeline.faults import FaultInjectingSession, TraceEvent, TrafficTrace
+from healing_pipeline.faults.harness import REPLAY_SETTINGS
+from healing_pipeline.utils.clock import VirtualClock, get_clock, set_clock
+from healing_pipeline.utils.http import get_session, set_session
+
+
+class ReplayEnv:
+    """Virtual clock and in-memory policy; `serve` installs the responses HTTP calls will get."""
+
+    def __init__(self):
+        self.clock = VirtualClock()
+        self.policy = RecoveryPolicy(IncidentStore(":memory:"), epsilon=0.0, rng=random.Random(0))
+        self.session = None
+
+    def serve(self, *events) -> FaultInjectingSession:
+        """Responses in order; plain status codes are shorthand for bare events."""
+        events = [
+            e if isinstance(e, TraceEvent) else TraceEvent(status=e, body={"id": 1} if e < 400 else None)
+            for e in events
+        ]
+        self.session = FaultInjectingSession(TrafficTrace(events), self.clock)
+        set_session(self.session)
+        return self.session
+
+
+@pytest.fixture
+def replay_env(monkeypatch):
+    for key, value in REPLAY_SETTINGS.items():
+        monkeypatch.setattr(settings, key, value)
+    previous = (get_clock(), get_session(), get_policy(create=False))
+    env = ReplayEnv()
+    set_clock(env.clock)
+    set_policy(env.policy)
+    try:
+        yield env
+    finally:
+        set_clock(previous[0])
+        set_session(previous[1])
+        set_policy(previous[2])
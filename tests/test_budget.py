@@ -0,0 +1,91 @@
+import time
+
+from healing_pipeline.config import settings
+from healing_pipeline.core import strategies
+from healing_pipeline.core.budget import bounded_timeout, deadline_after, fits_budget, remaining_budget
+from healing_pipeline.core.worker import TaxDataIngestor
+from healing_pipeline.graph.nodes import heal_node, ingest_node
+from healing_pipeline.graph.workflow import budget_exhausted
+
+
+def test_remaining_budget_uses_tighter_deadline():
+    now = time.time()
+    state = {"order_deadline": now + 30, "batch_deadline": now + 5}
+    assert 4 < remaining_budget(state) <= 5
+    assert remaining_budget({}) is None
+    assert deadline_after(0) is None
+
+
+def test_fits_budget_accounts_for_attempt_cost():
+    cost = settings.ATTEMPT_COST_SECONDS
+    assert fits_budget(2, 2 + cost)
+    assert not fits_budget(2, 2 + cost - 0.1)
+    assert fits_budget(600, None)
+
+
+def test_budget_exhausted_on_deadline_or_retries():
+    state = {"retry_count": 0, "max_retries": 3, "order_deadline": time.time() - 1, "batch_deadline": None}
+    assert budget_exhausted(state)
+    state.update(order_deadline=time.time() + 60)
+    assert not budget_exhausted(state)
+    state.update(retry_count=3)
+    assert budget_exhausted(state)
+
+
+def test_bounded_timeout_caps_at_remaining_budget():
+    now = time.time()
+    assert bounded_timeout(10, {}) == 10
+    assert bounded_timeout(None, {}) is None
+    assert 1 < bounded_timeout(10, {"order_deadline": now + 1.5}) <= 1.5
+    assert bounded_timeout(10, {"order_deadline": now - 5}) > 0
+
+
+def test_ingestion_timeout_respects_deadline(replay_env, monkeypatch):
+    replay_env.serve(200)
+    timeouts = []
+    execute = TaxDataIngestor.execute_ingestion
+
+    def spy(self, *args, **kwargs):
+        timeouts.append(kwargs.get("timeout"))
+        return execute(self, *args, **kwargs)
+
+    monkeypatch.setattr(TaxDataIngestor, "execute_ingestion", spy)
+    state = {"url": "http://api", "retry_count": 0, "order_deadline": replay_env.clock.time() + 1.5, "batch_deadline": None}
+    assert ingest_node(state)["status"] == "success"
+    assert timeouts == [1.5]
+
+
+class _BackupDown:
+    def best_endpoint(self, exclude=None):
+        return None
+
+    def is_healthy(self, url):
+        return False
+
+
+def _heal_state(replay_env, plan: dict, budget: float) -> dict:
+    return {
+        "url": "http://primary", "retry_count": 0, "max_retries": 3, "error": "503 Server Error",
+        "plan": plan, "order_deadline": replay_env.clock.time() + budget, "batch_deadline": None,
+        "error_history": []
+    }
+
+
+def test_budget_fallback_escalates_when_failover_fails(replay_env, monkeypatch):
+    monkeypatch.setattr(settings, "TAX_API_FAILOVER_URL", "http://backup")
+    monkeypatch.setattr(strategies, "get_health_checker", lambda start=True: _BackupDown())
+
+    # A 4s backoff cannot fit a 3s budget; the backup is down, so the order must escalate
+    update = heal_node(_heal_state(replay_env, {"recovery_action": "RETRY", "wait_seconds": 4}, budget=3))
+    assert update["status"] == "escalated"
+    assert update["error_history"][-1]["node"] == "heal"
+
+
+def test_failed_recovery_is_terminal_and_recorded(replay_env, monkeypatch):
+    monkeypatch.setattr(settings, "TAX_API_FAILOVER_URL", "http://backup")
+    monkeypatch.setattr(strategies, "get_health_checker", lambda start=True: _BackupDown())
+
+    update = heal_node(_heal_state(replay_env, {"recovery_action": "FAILOVER"}, budget=60))
+    assert update["status"] == "failed"
+    assert update["healing_result"] is False
+    assert "FAILOVER failed" in update["error_history"][-1]["error"]
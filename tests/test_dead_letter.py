@@ -0,0 +1,65 @@
+from healing_pipeline.config import settings
+from healing_pipeline.core.dead_letter import DeadLetterQueue
+from healing_pipeline.core.engine import PipelineEngine
+
+
+def test_put_pending_resolve_round_trip():
+    queue = DeadLetterQueue(":memory:")
+    first = queue.put({"amount": 15}, {"status": "escalated", "error": "503", "error_history": [{"node": "ingest"}]})
+    second = queue.put(None, {"status": "failed", "error": "boom"})
+
+    pending = queue.pending()
+    assert [e["id"] for e in pending] == [first, second]
+    assert pending[0]["order"] == {"amount": 15}
+    assert pending[0]["status"] == "escalated"
+    assert queue.pending(limit=1)[0]["id"] == first
+
+    queue.resolve(first)
+    queue.record_failed_replay(second, {"status": "failed", "error": "still down"})
+    (remaining,) = queue.pending()
+    assert remaining["id"] == second
+    assert remaining["error"] == "still down"
+    assert remaining["replay_attempts"] == 1
+
+
+def test_batch_dead_letters_escalated_order_and_continues(replay_env, monkeypatch):
+    monkeypatch.setattr(settings, "TAX_API_FAILOVER_URL", None)
+    replay_env.serve(503, 200)
+    queue = DeadLetterQueue(":memory:")
+    # Too little budget for the mock plan's 2s retry and no failover URL: the first order escalates
+    engine = PipelineEngine(url="http://api", retries=3, order_budget=1.5, dead_letters=queue, fast_path=False)
+
+    results = engine.run_batch([None, None])
+
+    assert [r["status"] for r in results] == ["escalated", "success"]
+    (entry,) = queue.pending()
+    assert entry["status"] == "escalated"
+    assert engine.last_report.to_dict()["orders_processed"] == 2
+
+
+def test_batch_dead_letters_order_that_runs_out_of_retries(replay_env):
+    replay_env.serve(503, 503, 200)
+    queue = DeadLetterQueue(":memory:")
+    engine = PipelineEngine(url="http://api", retries=1, order_budget=0, dead_letters=queue)
+
+    results = engine.run_batch([None, None])
+
+    assert [r["status"] for r in results] == ["failed", "success"]
+    assert [e["status"] for e in queue.pending()] == ["failed"]
+
+
+def test_replay_resolves_healed_entries_and_keeps_failures(replay_env):
+    queue = DeadLetterQueue(":memory:")
+    healed = queue.put(None, {"status": "failed"})
+    stuck = queue.put(None, {"status": "failed"})
+    replay_env.serve(200, 503)
+    engine = PipelineEngine(url="http://api", retries=1, order_budget=0, dead_letters=queue)
+
+    results = engine.replay_dead_letters()
+
+    assert [r["status"] for r in results] == ["success", "failed"]
+    (entry,) = queue.pending()
+    assert entry["id"] == stuck != healed
+    assert entry["replay_attempts"] == 1
+    # Replays update entries in place rather than dead-lettering again
+    assert len(queue.pending()) == 1
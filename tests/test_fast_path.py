@@ -0,0 +1,48 @@
+from healing_pipeline.core.dead_letter import DeadLetterQueue
+from healing_pipeline.core.engine import PipelineEngine
+from healing_pipeline.faults import TraceEvent
+from healing_pipeline.graph.nodes import ingest_node
+
+
+def _visited(engine: PipelineEngine) -> dict:
+    return {node: len(samples) for node, samples in engine.last_report.node_latencies.items()}
+
+
+def _engine() -> PipelineEngine:
+    return PipelineEngine(url="http://api", retries=3, order_budget=0, dead_letters=DeadLetterQueue(":memory:"),
+                          fast_path=True)
+
+
+def test_rate_limit_loops_through_backoff_without_analyze(replay_env):
+    replay_env.serve(429, 200)
+    engine = _engine()
+
+    assert engine.run()
+    assert _visited(engine) == {"ingest": 2, "backoff": 1, "enrich": 1}
+    assert engine.last_report.counters["fast_path_retries"] == 1
+
+
+def test_novel_error_still_goes_through_analyze(replay_env):
+    replay_env.serve(418, 200)
+    engine = _engine()
+
+    assert engine.run()
+    visited = _visited(engine)
+    assert "backoff" not in visited
+    assert visited["analyze"] == 1 and visited["heal"] == 1
+
+
+def test_fast_path_records_the_wait_it_actually_used(replay_env):
+    # Retry-After overrides the 1s base wait; the outcome belongs to the 4s arm
+    replay_env.serve(TraceEvent(status=429, retry_after=4), 200)
+
+    assert _engine().run()
+    stats = replay_env.policy.store.arm_stats("http_429")
+    assert list(stats) == [("RETRY", 4.0)]
+    assert stats[("RETRY", 4.0)]["successes"] == 1
+
+
+def test_status_code_is_carried_into_state(replay_env):
+    replay_env.serve(503)
+    update = ingest_node({"url": "http://api", "retry_count": 0, "order_deadline": None, "batch_deadline": None})
+    assert update["error_status"] == 503
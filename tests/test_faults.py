@@ -0,0 +1,155 @@
+import pytest
+import requests
+
+from healing_pipeline.config import settings
+from healing_pipeline.core.agent import AutomatedWatchdog
+from healing_pipeline.core.policy import IncidentStore, RecoveryPolicy
+from healing_pipeline.core.strategies import FailoverStrategy
+from healing_pipeline.faults import (
+    CONNECTION_ERROR,
+    TIMEOUT,
+    FaultInjectingSession,
+    RecordingSession,
+    ReplayHarness,
+    TraceEvent,
+    TrafficTrace,
+)
+from healing_pipeline.utils.clock import VirtualClock
+
+
+def test_session_replays_trace_and_charges_virtual_latency():
+    clock = VirtualClock()
+    trace = TrafficTrace([TraceEvent(status=429, latency=0.5, retry_after=3), TraceEvent(status=200, body={"ok": True})])
+    session = FaultInjectingSession(trace, clock)
+
+    first = session.get("http://api/todos/1")
+    assert first.status_code == 429
+    assert first.headers["Retry-After"] == "3"
+    assert clock.time() == 0.5
+
+    assert session.get("http://api/todos/1").json() == {"ok": True}
+    # Trace exhausted: the last event keeps repeating
+    assert session.get("http://api/todos/1").status_code == 200
+
+
+def test_trace_round_trips_through_jsonl(tmp_path):
+    path = str(tmp_path / "trace.jsonl")
+    TrafficTrace.rate_limit_demo().save(path)
+    loaded = TrafficTrace.load(path)
+    assert [e.status for e in loaded.events] == [429, 200]
+
+
+def test_harness_heals_demo_trace_without_real_sleeps():
+    report = ReplayHarness(TrafficTrace.rate_limit_demo(), retries=3).run(scenarios=20)
+    assert report["statuses"] == {"success": 20}
+    assert report["retries"] == 20
+    assert report["virtual_seconds"] > 0
+    assert report["wall_seconds"] < report["virtual_seconds"]
+
+
+def test_harness_reports_unrecoverable_trace():
+    trace = TrafficTrace([TraceEvent(status=503, latency=0.1)])
+    report = ReplayHarness(trace, retries=2).run(scenarios=3)
+    assert report["statuses"].get("success", 0) == 0
+    assert report["requests"] == 3 * 3
+
+
+def test_harness_runs_are_deterministic():
+    trace = TrafficTrace([TraceEvent(status=500), TraceEvent(status=500), TraceEvent(status=200, body={"id": 1})])
+    reports = [ReplayHarness(trace, retries=4).run(scenarios=50) for _ in range(3)]
+    assert len({(r["virtual_seconds"], r["requests"], r["retries"]) for r in reports}) == 1
+
+
+def test_harness_keeps_failover_probes_off_the_trace(monkeypatch):
+    probes = []
+    monkeypatch.setattr(settings, "TAX_API_FAILOVER_URL", "http://backup")
+    monkeypatch.setattr(FailoverStrategy, "probe", staticmethod(lambda url: probes.append(url) or True))
+    plan = {"recovery_action": "RETRY | FAILOVER", "wait_seconds": 1}
+    monkeypatch.setattr(AutomatedWatchdog, "analyze_error", lambda self, error, context: plan)
+
+    trace = TrafficTrace([TraceEvent(status=401), TraceEvent(status=200, body={"id": 1})])
+    report = ReplayHarness(trace, retries=2).run(scenarios=5)
+    assert probes == []
+    assert report["requests"] == 5 * 2
+
+
+def test_replayed_composite_commits_the_same_winner_as_wall_clock(monkeypatch):
+    # Mirrors test_composite_commits_first_success_and_cancels_retry: FAILOVER must beat a long RETRY
+    monkeypatch.setattr(settings, "TAX_API_FAILOVER_URL", "http://backup")
+    plan = {"recovery_action": "RETRY | FAILOVER", "wait_seconds": 30}
+    monkeypatch.setattr(AutomatedWatchdog, "analyze_error", lambda self, error, context: plan)
+    policy = RecoveryPolicy(IncidentStore(":memory:"), min_samples=1000)
+
+    trace = TrafficTrace([TraceEvent(status=401), TraceEvent(status=200, body={"id": 1})])
+    report = ReplayHarness(trace, retries=2, policy=policy).run(scenarios=20)
+
+    assert report["statuses"] == {"success": 20}
+    assert list(policy.store.arm_stats("http_401")) == [("FAILOVER", 0.0)]
+    assert report["virtual_seconds"] < 30
+
+
+def test_slow_events_time_out_at_the_request_timeout():
+    clock = VirtualClock()
+    session = FaultInjectingSession(TrafficTrace([TraceEvent(status=200, latency=30)]), clock)
+
+    with pytest.raises(requests.ReadTimeout):
+        session.get("http://api/todos/1", timeout=2.5)
+    # Only the timeout is charged, not the full latency
+    assert clock.time() == 2.5
+    assert session.get("http://api/todos/1", timeout=60).status_code == 200
+
+
+def test_error_events_raise_like_real_requests():
+    clock = VirtualClock()
+    trace = TrafficTrace([
+        TraceEvent(error=TIMEOUT, latency=1), TraceEvent(error=CONNECTION_ERROR), TraceEvent(status=200)
+    ])
+    session = FaultInjectingSession(trace, clock)
+
+    with pytest.raises(requests.Timeout):
+        session.get("http://api/todos/1")
+    with pytest.raises(requests.ConnectionError):
+        session.get("http://api/todos/1")
+    assert session.get("http://api/todos/1").status_code == 200
+
+
+def test_harness_heals_replayed_timeouts_via_fast_path():
+    trace = TrafficTrace([TraceEvent(error=TIMEOUT, latency=5), TraceEvent(status=200, body={"id": 1})])
+    report = ReplayHarness(trace, retries=3).run(scenarios=5)
+    assert report["statuses"] == {"success": 5}
+
+
+class _ScriptedAdapter(requests.adapters.BaseAdapter):
+    """Transport that times out once, then answers 200."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            raise requests.ReadTimeout("Read timed out.")
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"id": 1}'
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def test_recording_session_records_responses_and_failures(tmp_path):
+    session = RecordingSession()
+    session.mount("http://", _ScriptedAdapter())
+
+    with pytest.raises(requests.ReadTimeout):
+        session.get("http://api/todos/1")
+    session.get("http://api/todos/1")
+
+    path = str(tmp_path / "recorded.jsonl")
+    session.trace().save(path)
+    events = TrafficTrace.load(path).events
+    assert [(e.status, e.error) for e in events] == [(0, TIMEOUT), (200, None)]
+    assert events[1].body == {"id": 1}
@@ -0,0 +1,36 @@
+import requests
+
+from healing_pipeline.core.health import EndpointHealthChecker
+
+
+class _FakeSession:
+    """Answers probes from a url -> status map; missing urls raise a connection error."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+
+    def get(self, url, timeout=None):
+        for base, status in self.statuses.items():
+            if url.startswith(base):
+                response = requests.Response()
+                response.status_code = status
+                return response
+        raise requests.ConnectionError(url)
+
+
+def test_best_endpoint_prefers_available_and_excludes_current():
+    session = _FakeSession({"http://primary": 200, "http://backup": 200})
+    checker = EndpointHealthChecker(["http://primary", "http://backup", "http://down"], session=session)
+    checker.probe_all()
+
+    assert checker.is_healthy("http://primary") is True
+    assert checker.is_healthy("http://down") is False
+    assert checker.best_endpoint(exclude="http://primary") == "http://backup"
+
+
+def test_rate_limited_endpoint_counts_as_unhealthy():
+    checker = EndpointHealthChecker(["http://primary"], session=_FakeSession({"http://primary": 429}))
+    assert checker.is_healthy("http://primary") is None
+    checker.probe_all()
+    assert checker.is_healthy("http://primary") is False
+    assert checker.best_endpoint() is None
@@ -0,0 +1,159 @@
+import random
+import time
+
+import pytest
+
+from healing_pipeline.config import settings
+from healing_pipeline.core.policy import (
+    IncidentStore,
+    RecoveryPolicy,
+    error_signature,
+    is_transient,
+    share_classification,
+)
+from healing_pipeline.graph.nodes import heal_node, ingest_node
+from healing_pipeline.utils import shared_cache
+
+
+def test_error_signature_normalizes_http_and_free_text():
+    assert error_signature("429 Client Error: Too Many Requests for url: https://x/y") == "http_429"
+    assert error_signature("Connection reset after 12 bytes") == error_signature("Connection reset after 98 bytes")
+    assert error_signature(None) == "unknown"
+    assert error_signature("Tax validation failed", status_code=503) == "http_503"
+
+
+def test_port_numbers_are_not_mistaken_for_status_codes(monkeypatch):
+    monkeypatch.setattr(settings, "SHARED_CACHE_ENABLED", False)
+    timeout = "HTTPSConnectionPool(host='api.example.com', port=443): Read timed out. (read timeout=10)"
+    refused = (
+        "HTTPSConnectionPool(host='api.example.com', port=443): Max retries exceeded with url: /todos/1 "
+        "(Caused by NewConnectionError('<urllib3.connection.HTTPSConnection object at 0x7f>: "
+        "Failed to establish a new connection: [Errno 111] Connection refused'))"
+    )
+    for message in (timeout, refused):
+        assert not error_signature(message).startswith("http_")
+        assert is_transient(error_signature(message))
+
+
+def test_transient_classification(monkeypatch):
+    monkeypatch.setattr(settings, "SHARED_CACHE_ENABLED", False)
+    assert is_transient(error_signature("429 Client Error: Too Many Requests"))
+    assert is_transient(error_signature("HTTPSConnectionPool: Read timed out. (read timeout=10)"))
+    assert not is_transient(error_signature("401 Client Error: Unauthorized"))
+    assert not is_transient(error_signature("Tax validation failed"))
+
+
+def test_policy_defers_until_enough_history(tmp_path):
+    store = IncidentStore(str(tmp_path / "incidents.db"))
+    policy = RecoveryPolicy(store, min_samples=3, epsilon=0.0)
+
+    store.record("http_429", "RETRY", 1.0, True, 1.2)
+    assert policy.select("http_429") is None
+
+
+def test_policy_prefers_best_success_per_second(tmp_path):
+    store = IncidentStore(str(tmp_path / "incidents.db"))
+    policy = RecoveryPolicy(store, min_samples=3, epsilon=0.0, rng=random.Random(0))
+
+    # Long waits always work but are slow; short waits work often enough to win
+    for _ in range(3):
+        store.record("http_429", "RETRY", 4.0, True, 4.5)
+    store.record("http_429", "RETRY", 0.5, True, 0.7)
+    store.record("http_429", "RETRY", 0.5, False, 0.6)
+
+    plan = policy.select("http_429")
+    assert plan["recovery_action"] == "RETRY"
+    assert plan["wait_seconds"] == 0.5
+    assert plan["source"] == "policy"
+
+
+def test_policy_skips_failover_when_not_allowed(tmp_path):
+    store = IncidentStore(str(tmp_path / "incidents.db"))
+    policy = RecoveryPolicy(store, min_samples=1, epsilon=0.0)
+
+    store.record("http_503", "FAILOVER", 0.0, True, 0.2)
+    store.record("http_503", "RETRY", 2.0, True, 2.5)
+
+    assert policy.select("http_503")["recovery_action"] == "FAILOVER"
+    assert policy.select("http_503", allow_failover=False)["recovery_action"] == "RETRY"
+
+
+def test_arm_for_maps_committed_actions_onto_known_arms():
+    assert RecoveryPolicy.arm_for("failover", 2.0) == ("FAILOVER", 0.0)
+    assert RecoveryPolicy.arm_for("RETRY", 10) == ("RETRY", 4.0)
+    assert RecoveryPolicy.arm_for("RETRY", 0.7) == ("RETRY", 0.5)
+
+
+def _heal_then_ingest(plan: dict, monkeypatch) -> dict:
+    monkeypatch.setattr(settings, "TAX_API_FAILOVER_URL", "http://backup")
+    state = {
+        "url": "http://primary", "retry_count": 0, "max_retries": 3, "error": "503 Server Error",
+        "plan": plan, "order_deadline": None, "batch_deadline": None, "error_history": []
+    }
+    state.update(heal_node(state))
+    state.update(ingest_node(state))
+    assert state["status"] == "success"
+    return state
+
+
+def test_heal_outcomes_are_recorded_under_policy_arms(replay_env, monkeypatch):
+    replay_env.serve(200)
+
+    # FAILOVER plans often carry the LLM's wait; it must not create a phantom arm
+    _heal_then_ingest({"recovery_action": "FAILOVER", "wait_seconds": 2}, monkeypatch)
+    # LLM waits outside RETRY_WAITS snap to the nearest arm
+    _heal_then_ingest({"recovery_action": "RETRY", "wait_seconds": 10}, monkeypatch)
+
+    stats = replay_env.policy.store.arm_stats("http_503")
+    assert set(stats) == {("FAILOVER", 0.0), ("RETRY", 4.0)}
+    assert all(s["successes"] == 1 for s in stats.values())
+
+
+@pytest.fixture
+def shared_classifications(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SHARED_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "SHARED_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(shared_cache, "_caches", {})
+    return shared_cache.get_shared_cache("classifications", ttl_seconds=settings.CLASSIFICATION_TTL_SECONDS)
+
+
+def test_transient_classification_is_learned_from_retry_outcomes(shared_classifications, monkeypatch):
+    monkeypatch.setattr(settings, "POLICY_MIN_SAMPLES", 3)
+    store = IncidentStore(":memory:")
+    signature = error_signature("Upstream hiccup: partial response")
+
+    store.record(signature, "RETRY", 1.0, True, 1.1)
+    share_classification(store, signature)
+    # A single success (or a single LLM "RETRY" plan) is not enough evidence
+    assert not is_transient(signature)
+
+    store.record(signature, "RETRY", 1.0, True, 1.1)
+    store.record(signature, "RETRY", 2.0, False, 2.1)
+    share_classification(store, signature)
+    assert is_transient(signature)
+
+    # Retries stop working: the classification is corrected on the next refresh
+    for _ in range(3):
+        store.record(signature, "RETRY", 1.0, False, 1.1)
+    share_classification(store, signature)
+    assert not is_transient(signature)
+
+
+def test_client_errors_are_never_transient(shared_classifications):
+    shared_classifications.put("http_404", {"transient": True})
+    assert not is_transient("http_404")
+    assert is_transient("http_408") and is_transient("http_429")
+
+    store = IncidentStore(":memory:")
+    for _ in range(10):
+        store.record("http_400", "RETRY", 1.0, True, 1.0)
+    share_classification(store, "http_400")
+    assert shared_classifications.get("http_400") is None
+
+
+def test_classifications_expire(shared_classifications, monkeypatch):
+    shared_classifications.put("flaky upstream", {"transient": True})
+    assert is_transient("flaky upstream")
+    monkeypatch.setattr(shared_classifications, "ttl_seconds", 0)
+    time.sleep(0.01)
+    assert not is_transient("flaky upstream")
@@ -0,0 +1,61 @@
+import json
+from types import SimpleNamespace
+
+from healing_pipeline.cli import _write_report
+from healing_pipeline.core.report import RunReport, compare_reports, set_active_report, timed_node
+
+
+def _report(orders_ok: int, retries: int, analyze_seconds: float) -> dict:
+    report = RunReport()
+    set_active_report(report)
+    try:
+        node = timed_node("analyze", lambda state: state)
+        for _ in range(orders_ok):
+            report.begin_order()
+            node({})
+            report.record_node("analyze", analyze_seconds)
+            report.increment("llm_calls")
+            report.add_backoff(2.0)
+            report.end_order({"status": "success", "retry_count": retries})
+    finally:
+        set_active_report(None)
+    report.finish()
+    return report.to_dict()
+
+
+def test_report_aggregates_orders_and_nodes():
+    data = _report(orders_ok=3, retries=1, analyze_seconds=0.02)
+    assert data["orders_processed"] == 3
+    assert data["success_rate"] == 1.0
+    assert data["retries"] == {"total": 3, "per_order_mean": 1.0, "per_order_max": 1}
+    assert data["backoff_seconds"] == 6.0
+    assert data["counters"]["llm_calls"] == 3
+    assert data["node_latency"]["analyze"]["count"] == 6
+    assert sum(data["node_latency"]["analyze"]["histogram"].values()) == 6
+
+
+def test_compare_flags_regressions_only():
+    baseline = _report(orders_ok=3, retries=1, analyze_seconds=0.02)
+    same = dict(baseline)
+    assert compare_reports(same, baseline) == []
+
+    worse = _report(orders_ok=3, retries=3, analyze_seconds=0.2)
+    worse["orders_per_second"] = baseline["orders_per_second"]
+    regressions = compare_reports(worse, baseline)
+    assert any(r.startswith("retries per order") for r in regressions)
+    assert any(r.startswith("analyze p95_ms") for r in regressions)
+
+
+def test_baseline_is_checked_without_writing_a_report(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(_report(orders_ok=1, retries=1, analyze_seconds=0.01)))
+
+    current = RunReport()
+    current.begin_order()
+    current.end_order({"status": "success", "retry_count": 3})
+    current.finish()
+    engine = SimpleNamespace(last_report=current)
+
+    assert not _write_report(engine, None, str(baseline))
+    assert _write_report(engine, None, str(baseline), tolerance=1000)
+    assert [p.name for p in tmp_path.iterdir()] == ["baseline.json"]
@@ -0,0 +1,62 @@
+import multiprocessing
+
+import pytest
+
+from healing_pipeline.config import settings
+from healing_pipeline.utils.shared_cache import SharedCache, shared_cache_path
+
+
+def _writer(path, key, value):
+    SharedCache(path, slots=64).put(key, value)
+
+
+def test_put_get_round_trip_and_overwrite(tmp_path):
+    cache = SharedCache(str(tmp_path / "plans.cache"), slots=64)
+    assert cache.get("http_429") is None
+    assert cache.put("http_429", {"recovery_action": "RETRY", "wait_seconds": 2})
+    assert cache.get("http_429") == {"recovery_action": "RETRY", "wait_seconds": 2}
+
+    cache.put("http_429", {"recovery_action": "FAILOVER"})
+    assert cache.get("http_429") == {"recovery_action": "FAILOVER"}
+
+
+def test_oversized_values_are_rejected(tmp_path):
+    cache = SharedCache(str(tmp_path / "small.cache"), slots=8, slot_size=128)
+    assert not cache.put("big", "x" * 500)
+    assert cache.get("big") is None
+
+
+def test_full_probe_window_evicts_instead_of_failing(tmp_path):
+    cache = SharedCache(str(tmp_path / "tiny.cache"), slots=4)
+    for i in range(10):
+        assert cache.put(f"key-{i}", i)
+    assert cache.get("key-9") == 9
+
+
+def test_values_written_by_another_process_are_visible(tmp_path):
+    path = str(tmp_path / "shared.cache")
+    reader = SharedCache(path, slots=64)
+
+    process = multiprocessing.get_context("spawn").Process(target=_writer, args=(path, "http_503", {"transient": True}))
+    process.start()
+    process.join(timeout=30)
+
+    assert process.exitcode == 0
+    assert reader.get("http_503") == {"transient": True}
+
+
+def test_incompatible_layout_is_refused_not_truncated(tmp_path):
+    path = str(tmp_path / "plans.cache")
+    cache = SharedCache(path, slots=64)
+    cache.put("http_429", {"recovery_action": "RETRY"})
+
+    with pytest.raises(OSError):
+        SharedCache(path, slots=8)
+    # The existing mapping is untouched and still readable
+    assert cache.get("http_429") == {"recovery_action": "RETRY"}
+
+
+def test_each_layout_maps_its_own_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SHARED_CACHE_DIR", str(tmp_path))
+    assert shared_cache_path("plans", 64, 1024) != shared_cache_path("plans", 8, 1024)
+    assert shared_cache_path("plans", 64, 1024) != shared_cache_path("plans", 64, 512)
@@ -0,0 +1,55 @@
+import time
+
+from healing_pipeline.core.strategies import (
+    CompositeStrategy,
+    EscalateStrategy,
+    FailoverStrategy,
+    RecoveryStrategy,
+    RetryStrategy,
+    StrategyFactory,
+)
+
+
+class _Succeeds(RecoveryStrategy):
+    def execute(self, context: dict):
+        return {"action": "update_url", "url": "http://backup"}
+
+
+class _Fails(RecoveryStrategy):
+    def execute(self, context: dict):
+        return False
+
+
+def test_single_action_returns_plain_strategy():
+    assert isinstance(StrategyFactory.get_strategy("retry"), RetryStrategy)
+
+
+def test_multi_action_returns_composite_and_skips_unknown():
+    strategy = StrategyFactory.get_strategy("RETRY | FAILOVER | ESCALATE | BOGUS")
+    assert isinstance(strategy, CompositeStrategy)
+    assert [name for name, _ in strategy.members] == ["RETRY", "FAILOVER"]
+    assert [name for name, _ in strategy.fallbacks] == ["ESCALATE"]
+
+
+def test_register_plugin_strategy():
+    StrategyFactory.register("TEST_NOOP", _Succeeds)
+    try:
+        assert isinstance(StrategyFactory.get_strategy("test_noop"), _Succeeds)
+    finally:
+        StrategyFactory._strategies.pop("TEST_NOOP")
+
+
+def test_composite_commits_first_success_and_cancels_retry():
+    composite = CompositeStrategy([("RETRY", RetryStrategy()), ("PROBE", _Succeeds())])
+    started = time.monotonic()
+    result = composite.execute({"wait_seconds": 30, "retry_count": 0})
+    assert time.monotonic() - started < 5
+    assert result == {"action": "update_url", "url": "http://backup"}
+    assert composite.winner == "PROBE"
+
+
+def test_composite_falls_back_to_terminal_when_all_fail():
+    composite = CompositeStrategy([("FAILOVER", FailoverStrategy()), ("NOPE", _Fails()), ("ESCALATE", EscalateStrategy())])
+    result = composite.execute({"failover_url": None, "rationale": "both down"})
+    assert result == {"action": "escalate", "reason": "both down"}
+    assert composite.winner == "ESCALATE"
@@ -0,0 +1,41 @@
+from healing_pipeline.utils.tax_cache import TaxResultCache, order_fingerprint
+
+ORDER = {
+    'to_country': 'US', 'to_zip': '90002', 'to_state': 'CA',
+    'amount': 15, 'shipping': 1.5,
+    'line_items': [
+        {'id': '1', 'quantity': 1, 'unit_price': 15},
+        {'id': '2', 'quantity': 2, 'unit_price': 0},
+    ],
+}
+
+
+def test_fingerprint_ignores_irrelevant_fields_and_ordering():
+    reordered = dict(reversed(list(ORDER.items())))
+    reordered['line_items'] = list(reversed(ORDER['line_items']))
+    reordered['internal_note'] = 'not sent to TaxJar'
+    reordered['to_state'] = ' ca '
+    assert order_fingerprint(reordered) == order_fingerprint(ORDER)
+    assert order_fingerprint({**ORDER, 'amount': 16}) != order_fingerprint(ORDER)
+
+
+def test_cache_invalidates_on_version_and_rate_date(tmp_path):
+    path = str(tmp_path / "tax.db")
+    key = order_fingerprint(ORDER)
+    TaxResultCache(path, version="1", rate_effective_date="2026-01-01").put(key, {'amount_to_collect': 1.46})
+
+    assert TaxResultCache(path, version="1", rate_effective_date="2026-01-01").get(key) == {'amount_to_collect': 1.46}
+    assert TaxResultCache(path, version="1", rate_effective_date="2026-07-01").get(key) is None
+    # The stale entry was dropped on the mismatching read
+    assert TaxResultCache(path, version="1", rate_effective_date="2026-01-01").get(key) is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = TaxResultCache(str(tmp_path / "tax.db"), max_entries=2, version="1", rate_effective_date="")
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    cache.get("a")
+    cache.put("c", {"n": 3})
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
@@ -4,18 +4,18 @@ import os
 # Ensure src is in path and prioritized
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from healing_pipeline.core.engine import PipelineEngine
+from healing_pipeline.faults import ReplayHarness, TrafficTrace
 import healing_pipeline
 from healing_pipeline.utils.logging import logger
 
 def verify():
     logger.info("Starting Verification...")
     
-    # Initialize Engine with specific test URL if needed, or default
-    # The default creates a worker that simulates failure on 1st try
-    engine = PipelineEngine(retries=3)
+    # Replay the demo trace: the 1st request gets a 429, the retry succeeds
+    harness = ReplayHarness(TrafficTrace.rate_limit_demo(), retries=3)
     
-    success = engine.run()
+    report = harness.run(scenarios=1)
+    success = report['success_rate'] == 1.0
     
     if success:
         logger.success("Verification Passed: Pipeline healed and completed.")